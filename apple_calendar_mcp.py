@@ -4,12 +4,37 @@ Apple Calendar MCP Server - FastMCP implementation
 Provides tools to query and interact with Apple Calendar
 """
 
-import subprocess
+import asyncio
+import concurrent.futures
+import csv
+import io
 import os
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+import functools
+import hashlib
+import heapq
+import itertools
+import json
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple, NamedTuple, Callable, TextIO
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import objc
+    from Foundation import NSDate
+except ImportError:
+    # PyObjC is only available on macOS; without it reads skip EventKit
+    objc = NSDate = None
+
+try:
+    from EventKit import EKEventStore, EKEntityTypeEvent
+except ImportError:
+    # Without EventKit, reads go through Calendar's AppleScript interface
+    EKEventStore = EKEntityTypeEvent = None
+
 # Load user preferences from environment
 USER_PREFERENCES = os.environ.get("USER_CALENDAR_PREFERENCES", "")
 
@@ -17,6 +42,87 @@ USER_PREFERENCES = os.environ.get("USER_CALENDAR_PREFERENCES", "")
 mcp = FastMCP("Apple Calendar MCP")
 
 
+class TTLCache:
+    """Small in-memory cache whose entries expire after a per-entry TTL
+
+    generation is bumped by every clear(), so a caller that read it before
+    computing a value can tell whether the value may already be stale.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._max_entries = max_entries
+        self.generation = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        now = time.monotonic()
+        if key not in self._entries and len(self._entries) >= self._max_entries:
+            # Drop expired entries, then the oldest ones if it is still full
+            for old_key in [k for k, (expires_at, _) in self._entries.items() if now >= expires_at]:
+                del self._entries[old_key]
+            while len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.generation += 1
+
+
+# Raw results of read-only tools, cleared whenever a tool modifies the calendar
+RESULT_CACHE = TTLCache()
+
+# Event queries are cached briefly; repeated identical reads within a session
+# are common and every write tool clears the cache anyway
+READ_CACHE_TTL = 30
+
+# The set of calendars changes on the order of days; event writes don't affect it
+CALENDAR_NAMES_CACHE = TTLCache()
+CALENDAR_NAMES_TTL = 600
+
+
+def hashable_arg(value: Any) -> Any:
+    """Cache key form of a tool argument; lists (e.g. calendar_report's include) become tuples"""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def cached_result(ttl: float, scope: Optional[Callable[[], Any]] = None):
+    """Decorator that caches a read-only tool's result for ttl seconds
+
+    scope, if given, is called on every lookup and its value becomes part of
+    the key, e.g. date.today so a result never outlives the day it describes.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (
+                func.__name__,
+                scope() if scope is not None else None,
+                tuple(map(hashable_arg, args)),
+                tuple(sorted((name, hashable_arg(value)) for name, value in kwargs.items()))
+            )
+            result = RESULT_CACHE.get(key)
+            if result is None:
+                generation = RESULT_CACHE.generation
+                result = await func(*args, **kwargs)
+                # A write that cleared the cache meanwhile may have changed the result
+                if RESULT_CACHE.generation == generation:
+                    RESULT_CACHE.set(key, result, ttl)
+            return result
+        return wrapper
+    return decorator
+
+
 def inject_preferences(func):
     """Decorator that appends user preferences to tool docstrings"""
     if USER_PREFERENCES:
@@ -27,205 +133,1225 @@ def inject_preferences(func):
     return func
 
 
-def run_applescript(script: str) -> str:
-    """Execute AppleScript and return output"""
+# JXA program for the persistent osascript host. It reads one JSON request
+# per line, runs it through NSAppleScript (compiled once per source) on
+# osascript's main thread and writes one JSON reply per line. A request carries the
+# script source only until the host has compiled it; after that the script
+# id alone is sent. Requests are ASCII-only JSON, so a line can't be split
+# inside a multi-byte character.
+OSASCRIPT_HOST_SOURCE = r'''
+ObjC.import("Foundation");
+
+const input = $.NSFileHandle.fileHandleWithStandardInput;
+const output = $.NSFileHandle.fileHandleWithStandardOutput;
+const compiled = {};
+let pending = "";
+
+function errorMessage(info) {
+    if (!info || info.isNil()) return "unknown error";
+    const message = info.objectForKey("NSAppleScriptErrorMessage");
+    return message.isNil() ? ObjC.unwrap(info.description) : ObjC.unwrap(message);
+}
+
+function runScript(id, source, args) {
+    let script = compiled[id];
+    if (!script) {
+        if (source === undefined) throw new Error("unknown script " + id);
+        script = $.NSAppleScript.alloc.initWithSource(source);
+        const compileError = Ref();
+        if (!script.compileAndReturnError(compileError)) throw new Error(errorMessage(compileError[0]));
+        compiled[id] = script;
+    }
+
+    const argv = $.NSAppleEventDescriptor.listDescriptor;
+    args.forEach((arg, index) => argv.insertDescriptorAtIndex($.NSAppleEventDescriptor.descriptorWithString(arg), index + 1));
+    // 'aevt'/'oapp' run event with the argv list as its '----' direct parameter
+    const event = $.NSAppleEventDescriptor.appleEventWithEventClassEventIDTargetDescriptorReturnIDTransactionID(
+        0x61657674, 0x6f617070, $.NSAppleEventDescriptor.nullDescriptor, -1, 0
+    );
+    event.setParamDescriptorForKeyword(argv, 0x2d2d2d2d);
+
+    const runError = Ref();
+    const result = script.executeAppleEventError(event, runError);
+    if (result.isNil()) throw new Error(errorMessage(runError[0]));
+    return ObjC.unwrap(result.stringValue) || "";
+}
+
+function reply(message) {
+    output.writeData($(JSON.stringify(message) + "\n").dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+while (true) {
+    const data = input.availableData;
+    if (data.length === 0) break;
+    pending += ObjC.unwrap($.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding));
+
+    let newline;
+    while ((newline = pending.indexOf("\n")) >= 0) {
+        const line = pending.slice(0, newline);
+        pending = pending.slice(newline + 1);
+        try {
+            const request = JSON.parse(line);
+            reply({ok: true, result: runScript(request.id, request.script, request.args)});
+        } catch (e) {
+            reply({ok: false, error: String(e.message || e)});
+        }
+    }
+}
+'''
+
+# Replies carry whole tool results on one line
+OSASCRIPT_HOST_READ_LIMIT = 32 * 1024 * 1024
+
+# Consecutive host failures after which every call spawns its own osascript
+OSASCRIPT_HOST_MAX_FAILURES = 3
+
+
+class OsascriptHostError(Exception):
+    """The request never reached the persistent osascript host, so it is safe to retry elsewhere"""
+
+
+class OsascriptHost:
+    """Long-lived osascript process that runs scripts sent over its stdin
+
+    Saves a fork/exec and interpreter start per call, and keeps NSAppleScript
+    on the main thread of a process of its own rather than on a worker thread
+    of the server. Requests are serialized with a lock because the host runs one
+    script at a time; a timed-out or interrupted request kills the host so a
+    stale reply can never be read by the next caller.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._lock = asyncio.Lock()
+        # Ids stay fixed per source; _loaded holds those the running host has compiled
+        self._script_ids: Dict[str, int] = {}
+        self._loaded = set()
+        # Consecutive requests that lost the host; reset by any reply
+        self.failures = 0
+        self.disabled = False
+
+    async def _start(self):
+        if self._proc is None or self._proc.returncode is not None:
+            self._loaded.clear()
+            try:
+                self._proc = await asyncio.create_subprocess_exec(
+                    'osascript', '-l', 'JavaScript', '-e', OSASCRIPT_HOST_SOURCE,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    limit=OSASCRIPT_HOST_READ_LIMIT
+                )
+            except OSError as e:
+                raise OsascriptHostError(str(e))
+        return self._proc
+
+    def _kill(self):
+        if self._proc is not None and self._proc.returncode is None:
+            self._proc.kill()
+        self._proc = None
+
+    def _lost(self):
+        """Kill the host after a failed request; give up on it after repeated failures"""
+        self._kill()
+        self.failures += 1
+        if self.failures >= OSASCRIPT_HOST_MAX_FAILURES:
+            self.disabled = True
+
+    async def run(self, script: str, args: Tuple[str, ...], timeout: float = 120) -> str:
+        """Run a script in the host and return its result as text"""
+        script_id = self._script_ids.setdefault(script, len(self._script_ids))
+        async with self._lock:
+            try:
+                proc = await self._start()
+            except OsascriptHostError:
+                self._lost()
+                raise
+            message = {"id": script_id, "args": list(args)}
+            if script_id not in self._loaded:
+                message["script"] = script
+            request = json.dumps(message) + "\n"
+            try:
+                proc.stdin.write(request.encode("ascii"))
+                await proc.stdin.drain()
+            except ConnectionError as e:
+                # The host was already gone, so the script never ran
+                self._lost()
+                raise OsascriptHostError(str(e))
+            except BaseException:
+                self._kill()
+                raise
+
+            # From here on the script may have run (and changed the calendar),
+            # so failures are raised rather than retried
+            try:
+                line = await asyncio.wait_for(proc.stdout.readline(), timeout=timeout)
+            except ValueError as e:
+                self._lost()
+                raise Exception(f"osascript host reply unreadable: {e}")
+            except BaseException:
+                self._kill()
+                raise
+
+            if not line:
+                self._lost()
+                raise Exception("osascript host exited while running the script")
+
+            self.failures = 0
+            reply = json.loads(line)
+            if reply["ok"]:
+                self._loaded.add(script_id)
+        if not reply["ok"]:
+            raise Exception(f"AppleScript error: {reply['error']}")
+        return reply["result"].strip()
+
+
+OSASCRIPT_HOST = OsascriptHost()
+
+# Compiled .scpt files for the one-shot osascript path, named by source digest
+SCRIPT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "apple_calendar_mcp")
+COMPILED_SCRIPT_PATHS: Dict[str, str] = {}
+
+
+async def compiled_script_path(script: str) -> Optional[str]:
+    """Return the path of a .scpt compiled from the source, compiling it on first use
+
+    Returns None when osacompile is unavailable or rejects the source; the
+    caller then hands osascript the source, which reports the actual error.
+    """
+    path = COMPILED_SCRIPT_PATHS.get(script)
+    if path is not None:
+        return path
+
+    path = os.path.join(SCRIPT_CACHE_DIR, hashlib.sha1(script.encode("utf-8")).hexdigest() + ".scpt")
+    if not os.path.exists(path):
+        source_path = compiled_path = None
+        try:
+            os.makedirs(SCRIPT_CACHE_DIR, exist_ok=True)
+            # Unique temp names, so concurrent compiles of the same source
+            # never write over each other before the rename
+            source_fd, source_path = tempfile.mkstemp(suffix=".applescript", dir=SCRIPT_CACHE_DIR)
+            with os.fdopen(source_fd, "w", encoding="utf-8") as f:
+                f.write(script)
+            compiled_fd, compiled_path = tempfile.mkstemp(suffix=".scpt", dir=SCRIPT_CACHE_DIR)
+            os.close(compiled_fd)
+            proc = await asyncio.create_subprocess_exec(
+                'osacompile', '-o', compiled_path, source_path,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            if await proc.wait() != 0:
+                return None
+            # Rename into place so concurrent servers never run a partial file
+            os.replace(compiled_path, path)
+        except OSError:
+            return None
+        finally:
+            for leftover in (source_path, compiled_path):
+                if leftover is not None and os.path.exists(leftover):
+                    os.remove(leftover)
+
+    COMPILED_SCRIPT_PATHS[script] = path
+    return path
+
+
+async def _run_osascript(script: str, args: Tuple[str, ...], timeout: float = 120) -> str:
+    """Run osascript once and return its decoded stdout
+
+    osascript runs the precompiled .scpt for the source when one is available;
+    otherwise the source is piped over stdin ("osascript -") rather than passed
+    as an -e argument, so large sources never approach ARG_MAX. communicate()
+    drains stdout and stderr together, and the process is killed if the whole
+    run outlasts the timeout.
+    """
+    script_path = await compiled_script_path(script)
+    proc = await asyncio.create_subprocess_exec(
+        'osascript', script_path or '-', *args,
+        stdin=asyncio.subprocess.DEVNULL if script_path else asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
     try:
-        result = subprocess.run(
-            ['osascript', '-e', script],
-            capture_output=True,
-            text=True,
-            timeout=120
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(input=None if script_path else script.encode("utf-8")),
+            timeout=timeout
         )
-        if result.returncode != 0 and result.stderr:
-            raise Exception(f"AppleScript error: {result.stderr.strip()}")
-        return result.stdout.strip()
-    except subprocess.TimeoutExpired:
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+    if proc.returncode != 0 and stderr:
+        raise Exception(f"AppleScript error: {stderr.decode(errors='replace').strip()}")
+    return stdout.decode("utf-8", errors="replace")
+
+
+def check_script_args(args: Tuple[str, ...]) -> None:
+    """Validate run arguments before they reach osascript
+
+    User text is never spliced into script source, but argv cannot carry NUL
+    characters and a non-string would be coerced differently by each backend.
+    """
+    for arg in args:
+        if not isinstance(arg, str):
+            raise Exception(f"AppleScript arguments must be text, got {type(arg).__name__}")
+        if '\0' in arg:
+            raise Exception("AppleScript arguments cannot contain NUL characters")
+
+
+async def run_applescript(script: str, *args: str) -> str:
+    """Execute AppleScript and return output
+
+    Extra arguments are passed to the script's `on run argv` handler as text,
+    so the script source stays constant and its compiled form can be reused.
+    """
+    check_script_args(args)
+    try:
+        if not OSASCRIPT_HOST.disabled:
+            try:
+                return await OSASCRIPT_HOST.run(script, args)
+            except OsascriptHostError:
+                # The host never got the request, so run it once here instead;
+                # the next call restarts the host
+                pass
+
+        output = await _run_osascript(script, args)
+        return output.strip()
+    except asyncio.TimeoutError:
         raise Exception("AppleScript execution timed out")
     except Exception as e:
+        if is_missing_calendar_error(str(e)):
+            CALENDAR_NAMES_CACHE.clear()
         raise Exception(f"AppleScript execution failed: {str(e)}")
 
 
+def is_missing_calendar_error(message: str) -> bool:
+    """Whether an AppleScript error means a named calendar no longer exists"""
+    return (
+        "Calendar not found" in message
+        # Calendar reports "Can’t get calendar" with a typographic apostrophe
+        or "Can't get calendar" in message.replace("’", "'")
+    )
+
+
+CALENDAR_NAMES_SCRIPT = '''
+tell application "Calendar"
+    set calNames to name of every calendar
+end tell
+set AppleScript's text item delimiters to linefeed
+set namesText to calNames as text
+set AppleScript's text item delimiters to ""
+return namesText
+'''
+
+
+async def get_calendar_names() -> List[str]:
+    """Return calendar names, served from CALENDAR_NAMES_CACHE when fresh"""
+    names = CALENDAR_NAMES_CACHE.get("names")
+    if names is None:
+        generation = CALENDAR_NAMES_CACHE.generation
+        result = await run_applescript(CALENDAR_NAMES_SCRIPT)
+        names = result.split("\n") if result else []
+        if CALENDAR_NAMES_CACHE.generation == generation:
+            CALENDAR_NAMES_CACHE.set("names", names, CALENDAR_NAMES_TTL)
+    return names
+
+
+# Accepted tool input formats
+DATE_INPUT_FORMAT = "%Y-%m-%d"
+DATETIME_INPUT_FORMAT = "%Y-%m-%d %H:%M"
+
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+
+def _parse_fixed_width_date(date_str: str) -> Optional[datetime]:
+    """Parse the fixed-width YYYY-MM-DD[ HH:MM] inputs without strptime
+
+    Returns None when the shape does not match; raises ValueError when it
+    does but the date or time is out of range.
+    """
+    length = len(date_str)
+    if length not in (10, 16) or date_str[4] != '-' or date_str[7] != '-':
+        return None
+    if not (date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:10].isdigit()):
+        return None
+
+    year = int(date_str[0:4])
+    month = int(date_str[5:7])
+    day = int(date_str[8:10])
+
+    if length == 10:
+        return datetime(year, month, day)
+
+    if date_str[10] != ' ' or date_str[13] != ':':
+        return None
+    if not (date_str[11:13].isdigit() and date_str[14:16].isdigit()):
+        return None
+
+    return datetime(year, month, day, int(date_str[11:13]), int(date_str[14:16]))
+
+
+@functools.lru_cache(maxsize=256)
+def parse_date_arg(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD or YYYY-MM-DD HH:MM tool argument
+
+    Tools that work on date ranges parse their dates here before reading
+    any events, so other spellings such as "January 15, 2025" are rejected
+    rather than handed to AppleScript's own date parser.
+    """
+    try:
+        dt = _parse_fixed_width_date(date_str)
+        if dt is not None:
+            return dt
+
+        # Slow path for loosely formatted input such as 2025-1-5
+        return datetime.strptime(date_str, DATETIME_INPUT_FORMAT if ' ' in date_str else DATE_INPUT_FORMAT)
+    except ValueError:
+        pass
+    raise Exception(f"Invalid date: {date_str} (expected YYYY-MM-DD or YYYY-MM-DD HH:MM)")
+
+
+def applescript_date_arg(dt: datetime, include_time: bool) -> str:
+    """Render a date in the form format_applescript_date produces
+
+    Month names come from MONTH_NAMES rather than strftime, so the result
+    does not depend on the process locale.
+    """
+    if not include_time:
+        return f"{MONTH_NAMES[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+    hour12 = dt.hour % 12 or 12
+    ampm = "AM" if dt.hour < 12 else "PM"
+    return f"{MONTH_NAMES[dt.month - 1]} {dt.day:02d}, {dt.year} at {hour12:02d}:{dt.minute:02d}:{dt.second:02d} {ampm}"
+
+
+@functools.lru_cache(maxsize=1024)
 def format_applescript_date(date_str: str) -> str:
     """Convert YYYY-MM-DD or YYYY-MM-DD HH:MM to AppleScript date format"""
+    # parse_date_arg is cached too and only falls back to strptime for
+    # loosely formatted input such as 2025-1-5
     try:
-        if ' ' in date_str:
-            dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M")
-            return dt.strftime("%B %d, %Y at %I:%M:%S %p")
-        else:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            return dt.strftime("%B %d, %Y")
-    except ValueError:
+        dt = parse_date_arg(date_str)
+    except Exception:
         return date_str
+    return applescript_date_arg(dt, ' ' in date_str)
 
 
-def get_date_range_script(start_date: Optional[str], end_date: Optional[str], days_ahead: int = 7) -> str:
-    """Generate AppleScript for date range filtering"""
+def get_date_range_args(start_date: Optional[str], end_date: Optional[str], days_ahead: int = 7) -> List[str]:
+    """Generate run arguments consumed by DATE_RANGE_SCRIPT"""
+    # Resolve the defaults here rather than with AppleScript date arithmetic
+    now = datetime.now()
     if start_date:
-        start_script = f'set startDate to date "{format_applescript_date(start_date)}"'
+        start_arg = format_applescript_date(start_date)
     else:
-        start_script = 'set startDate to current date'
+        start_arg = applescript_date_arg(now, True)
 
     if end_date:
-        end_script = f'set endDate to date "{format_applescript_date(end_date)}"'
+        end_arg = format_applescript_date(end_date)
+    else:
+        end_arg = applescript_date_arg(now + timedelta(days=days_ahead), True)
+
+    return [start_arg, end_arg]
+
+
+def applescript_bool(value: bool) -> str:
+    """Encode a flag as a run argument for AppleScript"""
+    return "true" if value else "false"
+
+
+# Sets startDate/endDate from the startArg and endArg run arguments
+DATE_RANGE_SCRIPT = '''
+        set startDate to date startArg
+        set endDate to date endArg
+'''
+
+# Sets targetNames from the calArg run argument, one calendar name per line
+# (see calendar_names_arg); loops read the calendars with each name in turn,
+# so "every calendar" is never sent to Calendar
+CALENDAR_FILTER_SCRIPT = '''
+            set targetNames to paragraphs of calArg
+'''
+
+
+async def calendar_names_arg(calendar: Optional[str]) -> str:
+    """Run argument naming the calendars to read: the given one, or all cached names
+
+    The scripts skip calendars they cannot read, so a named calendar is
+    checked here and an unknown name raises instead of reading as empty.
+    """
+    if calendar:
+        await check_calendar_exists(calendar)
+        return calendar
+    # The scripts read every calendar with a given name, so each name goes once
+    return "\n".join(dict.fromkeys(await get_calendar_names()))
+
+
+async def check_calendar_exists(calendar: str) -> None:
+    """Raise if no calendar has this name, re-reading cached names once on a miss"""
+    if calendar in await get_calendar_names():
+        return
+    CALENDAR_NAMES_CACHE.clear()
+    if calendar not in await get_calendar_names():
+        raise Exception(f"Calendar not found: {calendar}")
+
+# Scripts that return raw data separate records and fields with ASCII control
+# characters, which never appear in event text, and leave formatting to Python
+RECORD_SEPARATOR = "\x1e"
+FIELD_SEPARATOR = "\x1f"
+SEPARATOR_LINE = "━" * 40
+
+# Script-level handler (call as "my isoDate(d)") giving a locale-independent date
+ISO_DATE_HANDLER = '''
+on isoDate(d)
+    return (d as «class isot» as string)
+end isoDate
+'''
+
+def split_records(result: str, field_count: int) -> List[List[str]]:
+    """Split delimited script output into records of field_count fields
+
+    Output is whitespace-stripped and the separators count as whitespace, so
+    empty trailing fields may be missing and are padded back.
+    """
+    records = []
+    for record in result.split(RECORD_SEPARATOR) if result else []:
+        fields = record.split(FIELD_SEPARATOR)
+        fields.extend([""] * (field_count - len(fields)))
+        records.append(fields)
+    return records
+
+
+def applescript_date_string(dt: datetime) -> str:
+    """Render a date the way AppleScript's date string does"""
+    return f"{dt:%A, %B} {dt.day}, {dt.year}"
+
+
+def applescript_time_string(dt: datetime) -> str:
+    """Render a time the way AppleScript's time string does"""
+    return f"{dt.hour % 12 or 12}:{dt:%M:%S %p}"
+
+
+class EventRecord(NamedTuple):
+    """One event as dumped by EVENT_DUMP_SCRIPT"""
+    start: datetime
+    end: datetime
+    all_day: bool
+    calendar: str
+    title: str
+    location: str
+    notes: str
+    # Calendar's UID for the event, shared by a recurring event's occurrences;
+    # only read when asked for
+    uid: str = ""
+
+
+# Dumps every event in a range with one batched fetch per property and
+# calendar; analysis and formatting happen in Python over the records
+EVENT_DUMP_SCRIPT = f'''
+on run argv
+    set {{startArg, endArg, calArg, includeNotes, searchArg, searchLocation, searchNotes, maxArg, includeUids}} to argv
+    set searchStart to date startArg
+    set searchEnd to date endArg
+    -- -1 reads every event; otherwise no more calendars are read once maxCount records exist
+    set maxCount to maxArg as integer
+    set records to {{}}
+
+    tell application "Calendar"
+        {CALENDAR_FILTER_SCRIPT}
+
+        -- One record per event: start, end, all-day flag, calendar, title, location, notes, uid
+        set AppleScript's text item delimiters to character id 31
+        repeat with nameRef in targetNames
+            if (count of records) = maxCount then exit repeat
+            set calName to contents of nameRef
+            -- Several calendars can share a name; read each of them once
+            repeat with calRef in (every calendar whose name is calName)
+                if (count of records) = maxCount then exit repeat
+                set aCal to contents of calRef
+
+                try
+                    -- A search term goes into the whose clause so Calendar filters natively
+                    if searchArg is "" then
+                        set calEvents to a reference to (every event of aCal whose start date >= searchStart and start date <= searchEnd)
+                    else if searchLocation is "true" and searchNotes is "true" then
+                        set calEvents to a reference to (every event of aCal whose (summary contains searchArg or location contains searchArg or description contains searchArg) and start date >= searchStart and start date <= searchEnd)
+                    else if searchLocation is "true" then
+                        set calEvents to a reference to (every event of aCal whose (summary contains searchArg or location contains searchArg) and start date >= searchStart and start date <= searchEnd)
+                    else if searchNotes is "true" then
+                        set calEvents to a reference to (every event of aCal whose (summary contains searchArg or description contains searchArg) and start date >= searchStart and start date <= searchEnd)
+                    else
+                        set calEvents to a reference to (every event of aCal whose summary contains searchArg and start date >= searchStart and start date <= searchEnd)
+                    end if
+                    set evtTitles to summary of calEvents
+                    set evtStarts to start date of calEvents
+                    set evtEnds to end date of calEvents
+                    set evtAllDays to allday event of calEvents
+                    set evtLocs to location of calEvents
+                    if includeNotes is "true" then set evtNotes to description of calEvents
+                    if includeUids is "true" then set evtUids to uid of calEvents
+
+                    repeat with i from 1 to count of evtTitles
+                        if (count of records) = maxCount then exit repeat
+                        set eventTitle to item i of evtTitles
+                        if eventTitle is missing value then set eventTitle to ""
+                        set evtLoc to item i of evtLocs
+                        if evtLoc is missing value then set evtLoc to ""
+                        set evtNote to ""
+                        if includeNotes is "true" then
+                            set evtNote to item i of evtNotes
+                            if evtNote is missing value then set evtNote to ""
+                        end if
+                        set evtUid to ""
+                        if includeUids is "true" then set evtUid to item i of evtUids
+
+                        set end of records to {{my isoDate(item i of evtStarts), my isoDate(item i of evtEnds), (item i of evtAllDays) as string, calName, eventTitle, evtLoc, evtNote, evtUid}} as text
+                    end repeat
+                end try
+            end repeat
+        end repeat
+    end tell
+
+    set AppleScript's text item delimiters to character id 30
+    set outputText to records as text
+    set AppleScript's text item delimiters to ""
+    return outputText
+end run
+{ISO_DATE_HANDLER}
+'''
+
+
+# EKAuthorizationStatus values; 3 is "authorized" before macOS 14 and
+# "full access" from macOS 14 on
+EK_STATUS_NOT_DETERMINED = 0
+EK_STATUS_FULL_ACCESS = 3
+
+# How long to wait for the user to answer the calendar access prompt
+EVENTKIT_ACCESS_TIMEOUT = 60
+
+# EventKit reads are safe from any thread; one worker per calendar up to this many
+EVENTKIT_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="eventkit")
+
+
+class EventStore:
+    """Reads events straight from the EventKit store, bypassing Apple events
+
+    Only used once calendar access is granted; otherwise it disables itself
+    and callers fall back to AppleScript.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._store = None
+        self.disabled = False
+
+    @staticmethod
+    def _request_access(store) -> bool:
+        """Prompt for calendar access and wait for the answer"""
+        answered = threading.Event()
+        granted = []
+
+        def completion(ok, error):
+            granted.append(bool(ok))
+            answered.set()
+
+        if hasattr(store, "requestFullAccessToEventsWithCompletion_"):
+            store.requestFullAccessToEventsWithCompletion_(completion)
+        else:
+            store.requestAccessToEntityType_completion_(EKEntityTypeEvent, completion)
+        return answered.wait(EVENTKIT_ACCESS_TIMEOUT) and granted[0]
+
+    def _authorized_store(self):
+        """Return the event store, requesting access on first use"""
+        with self._lock:
+            if self._store is None and not self.disabled:
+                try:
+                    status = EKEventStore.authorizationStatusForEntityType_(EKEntityTypeEvent)
+                    store = EKEventStore.alloc().init()
+                    if status == EK_STATUS_NOT_DETERMINED:
+                        granted = self._request_access(store)
+                    else:
+                        granted = status == EK_STATUS_FULL_ACCESS
+                except Exception:
+                    # EventKit is unusable here; use AppleScript from now on
+                    granted = False
+                if granted:
+                    self._store = store
+                else:
+                    self.disabled = True
+            return self._store
+
+    def events(
+        self,
+        start: datetime,
+        end: datetime,
+        calendar: Optional[str],
+        include_notes: bool,
+        include_all_day: bool = True,
+        limit: Optional[int] = None,
+        matcher: Optional[Callable[[EventRecord], bool]] = None
+    ) -> Optional[List[EventRecord]]:
+        """Events starting in [start, end] in start order, or None when access is not granted
+
+        With matcher, only events it accepts are returned. With limit, only the
+        first limit events are returned, and no calendar builds records for
+        more than that many.
+        """
+        store = self._authorized_store()
+        if store is None:
+            return None
+        if limit is not None:
+            limit = max(limit, 0)
+
+        calendars = list(store.calendarsForEntityType_(EKEntityTypeEvent))
+        if calendar:
+            calendars = [cal for cal in calendars if cal.title() == calendar]
+            if not calendars:
+                raise Exception(f"Calendar not found: {calendar}")
+
+        # Calendars are independent, so query them concurrently; each list
+        # comes back in start order and they are merged
+        merged = heapq.merge(
+            *EVENTKIT_POOL.map(
+                lambda cal: self._calendar_events(store, cal, start, end, include_notes, include_all_day, limit, matcher),
+                calendars
+            ),
+            key=lambda record: record.start
+        )
+        return list(itertools.islice(merged, limit))
+
+    @staticmethod
+    def _calendar_events(
+        store,
+        cal,
+        start: datetime,
+        end: datetime,
+        include_notes: bool,
+        include_all_day: bool,
+        limit: Optional[int],
+        matcher: Optional[Callable[[EventRecord], bool]]
+    ) -> List[EventRecord]:
+        """One calendar's matching events starting in [start, end] in start order, at most limit of them"""
+        with objc.autorelease_pool():
+            # The predicate matches events overlapping the range (end exclusive),
+            # so widen it by a second and keep those that start inside it
+            predicate = store.predicateForEventsWithStartDate_endDate_calendars_(
+                NSDate.dateWithTimeIntervalSince1970_(start.timestamp()),
+                NSDate.dateWithTimeIntervalSince1970_(end.timestamp() + 1),
+                [cal]
+            )
+
+            # Sort natively so records stop being built once limit is reached
+            events = store.eventsMatchingPredicate_(predicate).sortedArrayUsingSelector_("compareStartDateWithEvent:")
+
+            calendar_name = str(cal.title())
+            records = []
+            for event in events:
+                if limit is not None and len(records) >= limit:
+                    break
+                if not include_all_day and event.isAllDay():
+                    continue
+                event_start = datetime.fromtimestamp(event.startDate().timeIntervalSince1970())
+                if not start <= event_start <= end:
+                    continue
+                record = EventRecord(
+                    event_start,
+                    datetime.fromtimestamp(event.endDate().timeIntervalSince1970()),
+                    bool(event.isAllDay()),
+                    calendar_name,
+                    str(event.title() or ""),
+                    str(event.location() or ""),
+                    str(event.notes() or "") if include_notes else "",
+                    str(event.calendarItemExternalIdentifier() or "")
+                )
+                if matcher is None or matcher(record):
+                    records.append(record)
+            return records
+
+
+EVENT_STORE = EventStore() if EKEventStore is not None and NSDate is not None else None
+
+
+def resolve_date_range(start_date: Optional[str], end_date: Optional[str], days_ahead: int = 7) -> Tuple[datetime, datetime]:
+    """Resolve tool range arguments like get_date_range_args: now and now + days_ahead by default"""
+    now = datetime.now()
+    start = parse_date_arg(start_date) if start_date else now
+    end = parse_date_arg(end_date) if end_date else now + timedelta(days=days_ahead)
+    return start, end
+
+
+async def eventkit_events(
+    start: datetime,
+    end: datetime,
+    calendar: Optional[str] = None,
+    include_notes: bool = False,
+    include_all_day: bool = True,
+    limit: Optional[int] = None,
+    matcher: Optional[Callable[[EventRecord], bool]] = None
+) -> Optional[List[EventRecord]]:
+    """Events starting in [start, end] read through EventKit, or None to use AppleScript"""
+    if EVENT_STORE is None or EVENT_STORE.disabled:
+        return None
+
+    # Only a failed authorization disables the store; errors while reading
+    # events are reported for this call without giving up on EventKit
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, EVENT_STORE.events, start, end, calendar, include_notes, include_all_day, limit, matcher
+    )
+
+
+async def fetch_events(
+    start_date: Optional[str],
+    end_date: Optional[str],
+    calendar: Optional[str] = None,
+    include_notes: bool = False,
+    days_ahead: int = 7,
+    search_text: Optional[str] = None,
+    search_location: bool = False,
+    search_notes: bool = False,
+    limit: Optional[int] = None,
+    include_uids: bool = False
+) -> List[EventRecord]:
+    """Fetch all events starting in a range with a single EventKit query or script run
+
+    Missing range ends default like get_date_range_args: now and now + days_ahead.
+    With search_text, only events matching it (see event_matcher) are returned.
+    With limit, reading stops once that many events are found.
+    """
+    if limit is not None:
+        limit = max(limit, 0)
+
+    records = await eventkit_events(
+        *resolve_date_range(start_date, end_date, days_ahead),
+        calendar,
+        include_notes or search_notes,
+        limit=limit,
+        matcher=event_matcher(search_text, search_location, search_notes) if search_text else None
+    )
+    if records is not None:
+        return records
+
+    range_args = get_date_range_args(start_date, end_date, days_ahead)
+    filter_args = (
+        applescript_bool(include_notes),
+        search_text or "",
+        applescript_bool(search_location),
+        applescript_bool(search_notes),
+        str(-1 if limit is None else limit),
+        applescript_bool(include_uids)
+    )
+    result = await run_applescript(
+        EVENT_DUMP_SCRIPT,
+        *range_args,
+        await calendar_names_arg(calendar),
+        *filter_args
+    )
+    return [
+        EventRecord(
+            datetime.fromisoformat(start),
+            datetime.fromisoformat(end),
+            all_day == "true",
+            cal_name,
+            title,
+            location,
+            notes,
+            uid
+        )
+        for start, end, all_day, cal_name, title, location, notes, uid in split_records(result, 8)
+    ]
+
+
+def merge_busy_intervals(events: List[EventRecord]) -> List[Tuple[datetime, datetime]]:
+    """Sort the timed events' intervals once and merge the overlapping ones"""
+    merged = []
+    for start, end in sorted((event.start, event.end) for event in events if not event.all_day):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+BUSINESS_DAY_START = 9
+BUSINESS_DAY_END = 17
+
+
+def find_free_slots(
+    busy: List[Tuple[datetime, datetime]],
+    search_start: datetime,
+    search_end: datetime,
+    duration: timedelta,
+    business_hours_only: bool,
+    max_slots: int
+) -> List[Tuple[datetime, datetime]]:
+    """Enumerate free slots directly from the gaps between merged busy intervals"""
+    slots = []
+    gap_start = search_start
+    for busy_start, busy_end in busy + [(search_end, search_end)]:
+        gap_end = min(busy_start, search_end)
+        while len(slots) < max_slots and gap_start + duration <= gap_end:
+            if business_hours_only:
+                day_start = gap_start.replace(hour=BUSINESS_DAY_START, minute=0, second=0, microsecond=0)
+                if gap_start < day_start:
+                    gap_start = day_start
+                    continue
+                if gap_start + duration > day_start.replace(hour=BUSINESS_DAY_END):
+                    # Doesn't fit before closing; try the next morning
+                    gap_start = day_start + timedelta(days=1)
+                    continue
+            slots.append((gap_start, gap_start + duration))
+            gap_start += duration
+        if len(slots) >= max_slots or busy_start >= search_end:
+            break
+        gap_start = max(gap_start, busy_end)
+    return slots
+
+
+def find_conflicts(events: List[EventRecord]) -> List[Tuple[EventRecord, EventRecord]]:
+    """Return every overlapping pair of timed events
+
+    Events are sorted by start once; each event is then only compared with
+    the following events that start before it ends.
+    """
+    timed = sorted((event for event in events if not event.all_day), key=lambda event: event.start)
+    conflicts = []
+    for i, first in enumerate(timed):
+        for second in timed[i + 1:]:
+            if second.start >= first.end:
+                break
+            if second.end > first.start:
+                conflicts.append((first, second))
+    return conflicts
+
+
+def format_conflicts(conflicts: List[Tuple[EventRecord, EventRecord]]) -> List[str]:
+    """Render conflicting pairs the way detect_conflicts reports them"""
+    lines = []
+    for number, pair in enumerate(conflicts, start=1):
+        lines.append(f"⚠️  CONFLICT #{number}")
+        lines.append("")
+        for label, event in zip(("Event 1:", "Event 2:"), pair):
+            lines.append(label)
+            lines.append(f"  📌 {event.title}")
+            lines.append(f"  📅 {applescript_date_string(event.start)}")
+            lines.append(f"  🕐 {applescript_time_string(event.start)} - {applescript_time_string(event.end)}")
+            lines.append(f"  📁 {event.calendar}")
+            lines.append("")
+        lines[-1] = SEPARATOR_LINE
+        lines.append("")
+
+    if conflicts:
+        lines.append(f"Total conflicts: {len(conflicts)}")
+    else:
+        lines.append("✅ No conflicts found!")
+    return lines
+
+
+def format_statistics(events: List[EventRecord]) -> List[str]:
+    """Render event counts, meeting time and busiest hours"""
+    timed = [event for event in events if not event.all_day]
+    total_minutes = sum((event.end - event.start).total_seconds() for event in timed) / 60
+    average_minutes = total_minutes / len(timed) if timed else 0
+    total_hours, remaining_minutes = divmod(int(total_minutes), 60)
+
+    # Counter tallies the start hours in C, like a bincount over 24 buckets
+    hour_counts = Counter(event.start.hour for event in timed)
+    busiest = max(hour_counts.values(), default=0)
+
+    lines = [
+        "📊 SUMMARY",
+        f"  Total Events: {len(events)}",
+        f"  Timed Events: {len(timed)}",
+        f"  All-Day Events: {len(events) - len(timed)}",
+        "",
+        "⏱  TIME ANALYSIS",
+        f"  Total Meeting Time: {total_hours} hours {remaining_minutes} minutes",
+        f"  Average Meeting Duration: {round(average_minutes)} minutes",
+        "",
+        "🕐 BUSIEST HOURS"
+    ]
+    if busiest:
+        for hour, count in sorted(hour_counts.items()):
+            if count == busiest:
+                lines.append(f"  {hour % 12 or 12} {'AM' if hour < 12 else 'PM'}: {count} events")
     else:
-        end_script = f'set endDate to (current date) + ({days_ahead} * days)'
+        lines.append("  No timed events in this period")
+    return lines
+
 
-    return f"{start_script}\n{end_script}"
+def event_matcher(search_text: str, search_location: bool, search_notes: bool) -> Callable[[EventRecord], bool]:
+    """Build a predicate for events whose title (and optionally location/notes) contains the text
+
+    Case-insensitive, like AppleScript's "contains" under default considerations.
+    The needle and the field selection are resolved once, not per event.
+    """
+    needle = search_text.casefold()
+    fields = ["title"]
+    if search_location:
+        fields.append("location")
+    if search_notes:
+        fields.append("notes")
+    indices = tuple(EventRecord._fields.index(field) for field in fields)
+    return lambda event: any(needle in event[i].casefold() for i in indices)
+
+
+def format_event_list(events: List[EventRecord]) -> List[str]:
+    """Render events in the list_events layout"""
+    lines = []
+    for event in events:
+        if event.all_day:
+            time_str = "All Day"
+        else:
+            time_str = f"{applescript_time_string(event.start)} - {applescript_time_string(event.end)}"
+        lines.append(f"📌 {event.title}")
+        lines.append(f"   📅 {applescript_date_string(event.start)}")
+        lines.append(f"   🕐 {time_str}")
+        lines.append(f"   📁 {event.calendar}")
+        if event.location:
+            lines.append(f"   📍 {event.location}")
+        lines.append("")
+    return lines
 
 
 @mcp.tool()
 @inject_preferences
-def list_calendars(include_counts: bool = True) -> str:
+@cached_result(ttl=300)
+async def list_calendars(include_counts: bool = False) -> str:
     """
     List all available calendars with metadata.
 
     Args:
-        include_counts: Whether to include event counts for each calendar (default: True)
+        include_counts: Whether to include event counts for each calendar; Calendar reads
+            every event to count them, which is slow on large calendars (default: False)
 
     Returns:
         Formatted list of calendars with names and optional event counts
     """
 
-    count_script = '''
-        try
-            set eventCount to count of events of aCal
-            set outputText to outputText & " (" & eventCount & " events)"
-        on error
-            set outputText to outputText & " (count unavailable)"
-        end try
-    ''' if include_counts else ''
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "CALENDARS" & return & return
-        set calList to every calendar
-        set calCount to count of calList
-
-        set outputText to outputText & "Found " & calCount & " calendar(s)" & return
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
-
-        repeat with aCal in calList
-            set calName to name of aCal
-            set outputText to outputText & "📅 " & calName
+    script = '''
+    on run argv
+        set includeCounts to (item 1 of argv) is "true"
 
-            {count_script}
+        -- One record per calendar: name and event count ("" when not
+        -- requested, "?" when unavailable)
+        set records to {}
+        tell application "Calendar"
+            set calList to every calendar
+            set calNames to name of every calendar
 
-            set outputText to outputText & return
-        end repeat
+            set AppleScript's text item delimiters to character id 31
+            repeat with i from 1 to count of calList
+                set eventCount to ""
+                if includeCounts then
+                    try
+                        set eventCount to (count of events of item i of calList) as text
+                    on error
+                        set eventCount to "?"
+                    end try
+                end if
+                set end of records to {item i of calNames, eventCount} as text
+            end repeat
+        end tell
 
+        set AppleScript's text item delimiters to character id 30
+        set outputText to records as text
+        set AppleScript's text item delimiters to ""
         return outputText
-    end tell
+    end run
     '''
 
-    result = run_applescript(script)
-    return result
+    result = await run_applescript(script, applescript_bool(include_counts))
+    calendars = split_records(result, 2)
+
+    output_lines = [
+        "CALENDARS",
+        "",
+        f"Found {len(calendars)} calendar(s)",
+        SEPARATOR_LINE,
+        ""
+    ]
+    for name, event_count in calendars:
+        if event_count == "?":
+            output_lines.append(f"📅 {name} (count unavailable)")
+        elif event_count:
+            output_lines.append(f"📅 {name} ({event_count} events)")
+        else:
+            output_lines.append(f"📅 {name}")
+    return "\n".join(output_lines)
+
+
+def format_listed_events(range_start: str, range_end: str, events: List[EventRecord]) -> str:
+    """Render list_events output for already formatted range bounds"""
+    output_lines = [
+        "EVENTS",
+        "",
+        f"Date range: {range_start} to {range_end}",
+        SEPARATOR_LINE,
+        ""
+    ]
+    output_lines.extend(format_event_list(events))
+    output_lines.append(SEPARATOR_LINE)
+    output_lines.append(f"Total: {len(events)} event(s)")
+    return "\n".join(output_lines)
 
 
 @mcp.tool()
 @inject_preferences
-def list_events(
+@cached_result(ttl=READ_CACHE_TTL)
+async def list_events(
     calendar: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     max_events: int = 50,
-    include_all_day: bool = True
+    include_all_day: bool = True,
+    use_whose: bool = False
 ) -> str:
     """
     List events from a specific calendar or date range.
 
     Args:
         calendar: Optional calendar name to filter (if None, shows all calendars)
-        start_date: Start of date range in YYYY-MM-DD format (default: today)
-        end_date: End of date range in YYYY-MM-DD format (default: +7 days)
+        start_date: Start of date range (YYYY-MM-DD or YYYY-MM-DD HH:MM only, default: today)
+        end_date: End of date range (YYYY-MM-DD or YYYY-MM-DD HH:MM only, default: +7 days)
         max_events: Maximum number of events to return (default: 50)
         include_all_day: Whether to include all-day events (default: True)
+        use_whose: Let Calendar filter the date range with a "whose" query instead of
+            scanning start dates locally; may be faster on very large calendars (default: False)
 
     Returns:
         Formatted list of events with title, time, location, and calendar
     """
 
-    date_range_script = get_date_range_script(start_date, end_date)
-
-    calendar_filter = f'''
-        set targetCalendars to {{calendar "{calendar}"}}
-    ''' if calendar else '''
-        set targetCalendars to every calendar
-    '''
-
-    all_day_filter = '' if include_all_day else '''
-        if allday event of anEvent is false then
-    '''
-    all_day_filter_end = '' if include_all_day else 'end if'
+    start, end = resolve_date_range(start_date, end_date)
+    records = await eventkit_events(
+        start, end, calendar, include_all_day=include_all_day, limit=max_events
+    )
+    if records is not None:
+        return format_listed_events(
+            f"{applescript_date_string(start)} at {applescript_time_string(start)}",
+            f"{applescript_date_string(end)} at {applescript_time_string(end)}",
+            records
+        )
 
     script = f'''
-    tell application "Calendar"
-        set outputText to "EVENTS" & return & return
-        {date_range_script}
-
-        set outputText to outputText & "Date range: " & (startDate as string) & " to " & (endDate as string) & return
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
-
-        {calendar_filter}
-
-        set eventCount to 0
-        set allEvents to {{}}
+    on run argv
+        set {{calArg, startArg, endArg, maxEvents, includeAllDay, useWhose}} to argv
+        set maxEvents to maxEvents as integer
+        set includeAllDay to includeAllDay is "true"
+        set useWhose to useWhose is "true"
+        {DATE_RANGE_SCRIPT}
+        set fieldSep to character id 31
+        set recordSep to character id 30
+        set records to {{(startDate as string) & fieldSep & (endDate as string)}}
 
-        repeat with aCal in targetCalendars
-            set calName to name of aCal
+        tell application "Calendar"
+            -- One query covers every target calendar: each property comes back
+            -- as a list holding one list of values per calendar
+            if calArg is "" then
+                set calRef to a reference to every calendar
+            else
+                set calRef to a reference to (every calendar whose name is calArg)
+            end if
 
-            try
-                set calEvents to (every event of aCal whose start date >= startDate and start date <= endDate)
+            set calNames to name of calRef
+            if (count of calNames) = 0 then error "Calendar not found: " & calArg
 
-                repeat with anEvent in calEvents
-                    if eventCount >= {max_events} then exit repeat
+            -- A whose query makes Calendar compare every event through Apple events;
+            -- by default fetch all start dates at once and match the range locally
+            if useWhose and includeAllDay then
+                set eventRef to a reference to (every event of calRef whose start date >= startDate and start date <= endDate)
+            else if useWhose then
+                set eventRef to a reference to (every event of calRef whose start date >= startDate and start date <= endDate and allday event is false)
+            else
+                set eventRef to a reference to (every event of calRef)
+            end if
 
-                    {all_day_filter}
-                    try
-                        set eventTitle to summary of anEvent
-                        set eventStart to start date of anEvent
-                        set eventEnd to end date of anEvent
-                        set isAllDay to allday event of anEvent
-
-                        if isAllDay then
-                            set timeStr to "All Day"
-                        else
-                            set timeStr to time string of eventStart & " - " & time string of eventEnd
+            -- Without a whose query, all-day events are dropped while matching,
+            -- so no other property is ever fetched for them
+            set skipAllDay to not (includeAllDay or useWhose)
+            if skipAllDay then set allAllDays to allday event of eventRef
+
+            set allStarts to start date of eventRef
+            -- Stop scanning, across all calendars, once maxEvents are matched
+            set matches to {{}}
+            set matchCount to 0
+            repeat with c from 1 to count of allStarts
+                if matchCount >= maxEvents then exit repeat
+                set evtStarts to item c of allStarts
+                repeat with i from 1 to count of evtStarts
+                    set eventStart to item i of evtStarts
+                    if eventStart >= startDate and eventStart <= endDate then
+                        if not skipAllDay or item i of item c of allAllDays is false then
+                            set end of matches to {{c, i}}
+                            set matchCount to matchCount + 1
+                            if matchCount >= maxEvents then exit repeat
                         end if
+                    end if
+                end repeat
+            end repeat
 
-                        set outputText to outputText & "📌 " & eventTitle & return
-                        set outputText to outputText & "   📅 " & date string of eventStart & return
-                        set outputText to outputText & "   🕐 " & timeStr & return
-                        set outputText to outputText & "   📁 " & calName & return
-
-                        try
-                            set evtLoc to location of anEvent
-                            if evtLoc is not missing value and length of evtLoc > 0 then
-                                set outputText to outputText & "   📍 " & evtLoc & return
-                            end if
-                        end try
+            -- Fetch each remaining property for all calendars in one Apple event
+            if (count of matches) > 0 then
+                set allTitles to summary of eventRef
+                set allEnds to end date of eventRef
+                set allLocs to location of eventRef
+                if includeAllDay then set allAllDays to allday event of eventRef
+            end if
 
-                        set outputText to outputText & return
-                        set eventCount to eventCount + 1
-                    end try
-                    {all_day_filter_end}
-                end repeat
-            end try
-        end repeat
+            -- One record per event: start, end, all-day flag, calendar, title, location
+            set AppleScript's text item delimiters to fieldSep
+            repeat with aMatch in matches
+                set {{c, i}} to contents of aMatch
+                try
+                    set eventTitle to item i of item c of allTitles
+                    if eventTitle is missing value then set eventTitle to ""
+                    set evtLoc to item i of item c of allLocs
+                    if evtLoc is missing value then set evtLoc to ""
+                    set isAllDay to includeAllDay and item i of item c of allAllDays
 
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return
-        set outputText to outputText & "Total: " & eventCount & " event(s)" & return
+                    set end of records to {{my isoDate(item i of item c of allStarts), my isoDate(item i of item c of allEnds), isAllDay as string, item c of calNames, eventTitle, evtLoc}} as text
+                end try
+            end repeat
+        end tell
 
+        set AppleScript's text item delimiters to recordSep
+        set outputText to records as text
+        set AppleScript's text item delimiters to ""
         return outputText
-    end tell
+    end run
+    {ISO_DATE_HANDLER}
     '''
 
-    result = run_applescript(script)
-    return result
+    result = await run_applescript(
+        script,
+        calendar or "",
+        *get_date_range_args(start_date, end_date),
+        str(max_events),
+        applescript_bool(include_all_day),
+        applescript_bool(use_whose)
+    )
+
+    header, *events = split_records(result, 6)
+    return format_listed_events(header[0], header[1], [
+        EventRecord(
+            datetime.fromisoformat(event_start),
+            datetime.fromisoformat(event_end),
+            is_all_day == "true",
+            cal_name,
+            event_title,
+            event_location,
+            ""
+        )
+        for event_start, event_end, is_all_day, cal_name, event_title, event_location in events
+    ])
 
 
 @mcp.tool()
 @inject_preferences
-def get_event_details(
+async def get_event_details(
     calendar: str,
     event_title: str,
     start_date: Optional[str] = None
@@ -242,126 +1368,137 @@ def get_event_details(
         Full event details including notes, attendees, recurrence, and reminders
     """
 
-    date_filter = ''
-    if start_date:
-        date_filter = f'''
-            set searchDate to date "{format_applescript_date(start_date)}"
+    script = '''
+    on run argv
+        set {calArg, titleArg, dateArg} to argv
+        if dateArg is not "" then
+            set searchDate to date dateArg
             set searchEndDate to searchDate + 1 * days
-            set matchingEvents to (every event of targetCal whose summary contains "{event_title}" and start date >= searchDate and start date < searchEndDate)
-        '''
-    else:
-        date_filter = f'''
-            set matchingEvents to (every event of targetCal whose summary contains "{event_title}")
-        '''
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "EVENT DETAILS" & return & return
-
-        try
-            set targetCal to calendar "{calendar}"
-            {date_filter}
+        end if
 
-            if (count of matchingEvents) = 0 then
-                return "No event found matching: {event_title}"
-            end if
+        tell application "Calendar"
+            set outputLines to {"EVENT DETAILS", ""}
 
-            set targetEvent to item 1 of matchingEvents
+            try
+                set targetCal to calendar calArg
 
-            -- Basic info
-            set eventTitle to summary of targetEvent
-            set eventStart to start date of targetEvent
-            set eventEnd to end date of targetEvent
-            set isAllDay to allday event of targetEvent
+                -- "first event" lets Calendar stop at the first match
+                try
+                    if dateArg is "" then
+                        set targetEvent to first event of targetCal whose summary contains titleArg
+                    else
+                        set targetEvent to first event of targetCal whose summary contains titleArg and start date >= searchDate and start date < searchEndDate
+                    end if
+                on error
+                    return "No event found matching: " & titleArg
+                end try
 
-            set outputText to outputText & "📌 " & eventTitle & return
-            set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
+                -- All scalar properties in one Apple event; the fields below
+                -- are read from the local record instead of from Calendar
+                set evtProps to properties of targetEvent
+                set eventTitle to summary of evtProps
+                set eventStart to start date of evtProps
+                set eventEnd to end date of evtProps
+                set isAllDay to allday event of evtProps
+
+                set end of outputLines to "📌 " & eventTitle
+                set end of outputLines to "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+                set end of outputLines to ""
+
+                set end of outputLines to "📅 Date: " & date string of eventStart
+
+                if isAllDay then
+                    set end of outputLines to "🕐 Time: All Day"
+                else
+                    set end of outputLines to "🕐 Start: " & time string of eventStart
+                    set end of outputLines to "🕐 End: " & time string of eventEnd
+                end if
 
-            set outputText to outputText & "📅 Date: " & date string of eventStart & return
+                set end of outputLines to "📁 Calendar: " & calArg
 
-            if isAllDay then
-                set outputText to outputText & "🕐 Time: All Day" & return
-            else
-                set outputText to outputText & "🕐 Start: " & time string of eventStart & return
-                set outputText to outputText & "🕐 End: " & time string of eventEnd & return
-            end if
+                -- Location
+                try
+                    set evtLoc to location of evtProps
+                    if evtLoc is not missing value and evtLoc is not "" then
+                        set end of outputLines to "📍 Location: " & evtLoc
+                    end if
+                end try
 
-            set outputText to outputText & "📁 Calendar: {calendar}" & return
+                -- URL
+                try
+                    set eventURL to url of evtProps
+                    if eventURL is not missing value and eventURL is not "" then
+                        set end of outputLines to "🔗 URL: " & eventURL
+                    end if
+                end try
 
-            -- Location
-            try
-                set evtLoc to location of targetEvent
-                if evtLoc is not missing value and length of evtLoc > 0 then
-                    set outputText to outputText & "📍 Location: " & evtLoc & return
-                end if
-            end try
+                -- Notes/Description
+                try
+                    set eventNotes to description of evtProps
+                    if eventNotes is not missing value and eventNotes is not "" then
+                        set end of outputLines to ""
+                        set end of outputLines to "📝 Notes:"
+                        set end of outputLines to eventNotes
+                    end if
+                end try
 
-            -- URL
-            try
-                set eventURL to url of targetEvent
-                if eventURL is not missing value and eventURL is not "" then
-                    set outputText to outputText & "🔗 URL: " & eventURL & return
-                end if
-            end try
+                -- Recurrence
+                try
+                    set eventRecurrence to recurrence of evtProps
+                    if eventRecurrence is not missing value and eventRecurrence is not "" then
+                        set end of outputLines to ""
+                        set end of outputLines to "🔄 Recurrence: " & eventRecurrence
+                    end if
+                end try
 
-            -- Notes/Description
-            try
-                set eventNotes to description of targetEvent
-                if eventNotes is not missing value and eventNotes is not "" then
-                    set outputText to outputText & return & "📝 Notes:" & return
-                    set outputText to outputText & eventNotes & return
-                end if
-            end try
+                -- Attendees: one Apple event per property for the whole list
+                try
+                    set attendeeRef to a reference to every attendee of targetEvent
+                    set attendeeNames to display name of attendeeRef
+                    if (count of attendeeNames) > 0 then
+                        set attendeeStatuses to participation status of attendeeRef
+                        set end of outputLines to ""
+                        set end of outputLines to "👥 Attendees:"
+                        repeat with i from 1 to count of attendeeNames
+                            set end of outputLines to "   • " & item i of attendeeNames & " (" & item i of attendeeStatuses & ")"
+                        end repeat
+                    end if
+                end try
 
-            -- Recurrence
-            try
-                set eventRecurrence to recurrence of targetEvent
-                if eventRecurrence is not missing value and eventRecurrence is not "" then
-                    set outputText to outputText & return & "🔄 Recurrence: " & eventRecurrence & return
-                end if
-            end try
+                -- Alarms/Reminders
+                try
+                    set triggerIntervals to trigger interval of every display alarm of targetEvent
+                    if (count of triggerIntervals) > 0 then
+                        set end of outputLines to ""
+                        set end of outputLines to "⏰ Reminders:"
+                        repeat with triggerInterval in triggerIntervals
+                            set minutesBefore to (triggerInterval / -60) as integer
+                            set end of outputLines to "   • " & minutesBefore & " minutes before"
+                        end repeat
+                    end if
+                end try
 
-            -- Attendees
-            try
-                set attendeeList to attendees of targetEvent
-                if (count of attendeeList) > 0 then
-                    set outputText to outputText & return & "👥 Attendees:" & return
-                    repeat with anAttendee in attendeeList
-                        set attendeeName to display name of anAttendee
-                        set attendeeStatus to participation status of anAttendee
-                        set outputText to outputText & "   • " & attendeeName & " (" & attendeeStatus & ")" & return
-                    end repeat
-                end if
-            end try
+                set AppleScript's text item delimiters to return
+                set outputText to outputLines as text
+                set AppleScript's text item delimiters to ""
+                return outputText
 
-            -- Alarms/Reminders
-            try
-                set alarmList to display alarms of targetEvent
-                if (count of alarmList) > 0 then
-                    set outputText to outputText & return & "⏰ Reminders:" & return
-                    repeat with anAlarm in alarmList
-                        set triggerInterval to trigger interval of anAlarm
-                        set minutesBefore to (triggerInterval / -60) as integer
-                        set outputText to outputText & "   • " & minutesBefore & " minutes before" & return
-                    end repeat
-                end if
+            on error errMsg
+                return "Error: " & errMsg
             end try
-
-            return outputText
-
-        on error errMsg
-            return "Error: " & errMsg
-        end try
-    end tell
+        end tell
+    end run
     '''
 
-    result = run_applescript(script)
+    date_arg = format_applescript_date(start_date) if start_date else ""
+    result = await run_applescript(script, calendar, event_title, date_arg)
     return result
 
 
 @mcp.tool()
 @inject_preferences
-def get_todays_schedule(calendar: Optional[str] = None) -> str:
+@cached_result(ttl=60, scope=date.today)
+async def get_todays_schedule(calendar: Optional[str] = None) -> str:
     """
     Get a quick view of today's events across all calendars.
 
@@ -372,85 +1509,108 @@ def get_todays_schedule(calendar: Optional[str] = None) -> str:
         Chronological list of today's events with times and locations
     """
 
-    calendar_filter = f'''
-        set targetCalendars to {{calendar "{calendar}"}}
-    ''' if calendar else '''
-        set targetCalendars to every calendar
-    '''
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    records = await eventkit_events(today, today + timedelta(days=1) - timedelta(microseconds=1), calendar)
+    if records is not None:
+        events = [
+            (event.start, event.all_day, event.calendar, event.title, event.location)
+            for event in records
+        ]
+    else:
+        events = await todays_events_applescript(today, calendar)
+
+    output_lines = [
+        "TODAY'S SCHEDULE",
+        applescript_date_string(today),
+        SEPARATOR_LINE,
+        ""
+    ]
+
+    for event_start, is_all_day, cal_name, event_title, event_location in events:
+        if is_all_day:
+            event_line = f"🌅 ALL DAY: {event_title}"
+        else:
+            event_line = f"🕐 {applescript_time_string(event_start)} - {event_title}"
+        if event_location:
+            event_line += f" @ {event_location}"
+        output_lines.append(f"{event_line} [{cal_name}]")
 
-    script = f'''
-    tell application "Calendar"
-        set outputText to "TODAY'S SCHEDULE" & return
-        set outputText to outputText & date string of (current date) & return
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
+    if not events:
+        output_lines.append("No events scheduled for today.")
 
-        set todayStart to current date
-        set time of todayStart to 0
-        set todayEnd to todayStart + 1 * days
+    output_lines.append("")
+    output_lines.append(SEPARATOR_LINE)
+    output_lines.append(f"Total: {len(events)} event(s)")
+    return "\n".join(output_lines)
 
-        {calendar_filter}
 
-        set eventCount to 0
-        set allDayEvents to {{}}
-        set timedEvents to {{}}
+async def todays_events_applescript(today: datetime, calendar: Optional[str]) -> List[Tuple[datetime, bool, str, str, str]]:
+    """Today's events as (start, all-day, calendar, title, location) read through Calendar"""
+    script = f'''
+    on run argv
+        set {{calArg, startArg, endArg}} to argv
+        set todayStart to date startArg
+        set todayEnd to date endArg
 
-        repeat with aCal in targetCalendars
-            set calName to name of aCal
+        set records to {{}}
 
-            try
-                set calEvents to (every event of aCal whose start date >= todayStart and start date < todayEnd)
+        tell application "Calendar"
+            {CALENDAR_FILTER_SCRIPT}
+
+            -- One record per event: start, all-day flag, calendar, title, location
+            set AppleScript's text item delimiters to character id 31
+            repeat with nameRef in targetNames
+                set calName to contents of nameRef
+                -- Several calendars can share a name; read each of them once
+                repeat with calRef in (every calendar whose name is calName)
+                    set aCal to contents of calRef
 
-                repeat with anEvent in calEvents
                     try
-                        set eventTitle to summary of anEvent
-                        set eventStart to start date of anEvent
-                        set eventEnd to end date of anEvent
-                        set isAllDay to allday event of anEvent
-
-                        set evtLoc to ""
-                        try
-                            set evtLoc to location of anEvent
-                        end try
-
-                        if isAllDay then
-                            set outputText to outputText & "🌅 ALL DAY: " & eventTitle
-                            if length of evtLoc > 0 then
-                                set outputText to outputText & " @ " & evtLoc
-                            end if
-                            set outputText to outputText & " [" & calName & "]" & return
-                        else
-                            set timeStr to time string of eventStart
-                            set outputText to outputText & "🕐 " & timeStr & " - " & eventTitle
-                            if length of evtLoc > 0 then
-                                set outputText to outputText & " @ " & evtLoc
-                            end if
-                            set outputText to outputText & " [" & calName & "]" & return
-                        end if
+                        -- Fetch each property for all of today's events in one Apple event
+                        set calEvents to a reference to (every event of aCal whose start date >= todayStart and start date < todayEnd)
+                        set evtTitles to summary of calEvents
+                        set evtStarts to start date of calEvents
+                        set evtAllDays to allday event of calEvents
+                        set evtLocs to location of calEvents
+
+                        repeat with i from 1 to count of evtTitles
+                            try
+                                set eventTitle to item i of evtTitles
+                                if eventTitle is missing value then set eventTitle to ""
+                                set evtLoc to item i of evtLocs
+                                if evtLoc is missing value then set evtLoc to ""
 
-                        set eventCount to eventCount + 1
+                                set end of records to {{my isoDate(item i of evtStarts), (item i of evtAllDays) as string, calName, eventTitle, evtLoc}} as text
+                            end try
+                        end repeat
                     end try
                 end repeat
-            end try
-        end repeat
-
-        if eventCount = 0 then
-            set outputText to outputText & "No events scheduled for today." & return
-        end if
-
-        set outputText to outputText & return & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return
-        set outputText to outputText & "Total: " & eventCount & " event(s)" & return
+            end repeat
+        end tell
 
+        set AppleScript's text item delimiters to character id 30
+        set outputText to records as text
+        set AppleScript's text item delimiters to ""
         return outputText
-    end tell
+    end run
+    {ISO_DATE_HANDLER}
     '''
 
-    result = run_applescript(script)
-    return result
+    result = await run_applescript(
+        script,
+        await calendar_names_arg(calendar),
+        applescript_date_arg(today, True),
+        applescript_date_arg(today + timedelta(days=1), True)
+    )
+    return [
+        (datetime.fromisoformat(event_start), is_all_day == "true", cal_name, event_title, event_location)
+        for event_start, is_all_day, cal_name, event_title, event_location in split_records(result, 5)
+    ]
 
 
 @mcp.tool()
 @inject_preferences
-def get_calendar_overview() -> str:
+async def get_calendar_overview() -> str:
     """
     Get a quick dashboard view of your calendars.
 
@@ -461,49 +1621,53 @@ def get_calendar_overview() -> str:
         - Tip to use other tools for detailed views
     """
 
-    script = '''
-    tell application "Calendar"
-        set outputText to "╔══════════════════════════════════════════╗" & return
-        set outputText to outputText & "║      CALENDAR OVERVIEW                   ║" & return
-        set outputText to outputText & "╚══════════════════════════════════════════╝" & return & return
-
-        -- Calendar List
-        set outputText to outputText & "📅 YOUR CALENDARS" & return
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return
-
-        set calList to every calendar
-        set calCount to count of calList
-
-        repeat with aCal in calList
-            set calName to name of aCal
-            set outputText to outputText & "  📁 " & calName & return
-        end repeat
+    # Only the calendar names come from Calendar, and those are cached
+    cal_names = await get_calendar_names()
+
+    output_lines = [
+        "╔══════════════════════════════════════════╗",
+        "║      CALENDAR OVERVIEW                   ║",
+        "╚══════════════════════════════════════════╝",
+        "",
+        "📅 YOUR CALENDARS",
+        SEPARATOR_LINE,
+    ]
+    output_lines.extend(f"  📁 {name}" for name in cal_names)
+    output_lines.extend([
+        "",
+        f"Total: {len(cal_names)} calendar(s)",
+        "",
+        f"📆 TODAY: {applescript_date_string(datetime.now())}",
+        "",
+        "═══════════════════════════════════════════════════",
+        "💬 Quick commands:",
+        "  • get_todays_schedule - See today's events",
+        "  • list_events - Browse events by date range",
+        "  • list_calendars(include_counts=True) - event counts (slow)",
+    ])
+    return "\n".join(output_lines)
 
-        set outputText to outputText & return
-        set outputText to outputText & "Total: " & calCount & " calendar(s)" & return
-        set outputText to outputText & return
 
-        -- Today's date
-        set outputText to outputText & "📆 TODAY: " & date string of (current date) & return
-        set outputText to outputText & return
+@mcp.tool()
+@inject_preferences
+async def invalidate_calendar_cache() -> str:
+    """
+    Clear cached calendar names and tool results.
 
-        set outputText to outputText & "═══════════════════════════════════════════════════" & return
-        set outputText to outputText & "💬 Quick commands:" & return
-        set outputText to outputText & "  • get_todays_schedule - See today's events" & return
-        set outputText to outputText & "  • list_events - Browse events by date range" & return
-        set outputText to outputText & "  • list_calendars - Get event counts per calendar" & return
+    Use after changing calendars or events outside this server (e.g. in the
+    Calendar app) to see the changes before the caches expire.
 
-        return outputText
-    end tell
-    '''
-
-    result = run_applescript(script)
-    return result
+    Returns:
+        Confirmation message
+    """
+    RESULT_CACHE.clear()
+    CALENDAR_NAMES_CACHE.clear()
+    return "✅ Calendar cache cleared"
 
 
 @mcp.tool()
 @inject_preferences
-def create_event(
+async def create_event(
     calendar: str,
     title: str,
     start_date: str,
@@ -537,77 +1701,89 @@ def create_event(
     start_formatted = format_applescript_date(start_date)
     end_formatted = format_applescript_date(end_date)
 
-    # Build optional properties
-    optional_props = []
+    # Optional values are passed as empty strings and skipped inside the script
+    script = '''
+    on run argv
+        set {calArg, titleArg, startArg, endArg, locArg, notesArg, urlArg, allDayArg, attendeesArg, alertArg} to argv
+        set startDate to date startArg
+        set endDate to date endArg
 
-    if location:
-        optional_props.append(f'set location of newEvent to "{location}"')
+        tell application "Calendar"
+            set targetCal to calendar calArg
 
-    if notes:
-        # Escape quotes in notes
-        escaped_notes = notes.replace('"', '\\"')
-        optional_props.append(f'set description of newEvent to "{escaped_notes}"')
+            tell targetCal
+                set newEvent to make new event with properties {summary:titleArg, start date:startDate, end date:endDate}
 
-    if url:
-        optional_props.append(f'set url of newEvent to "{url}"')
+                if locArg is not "" then set location of newEvent to locArg
+                if notesArg is not "" then set description of newEvent to notesArg
+                if urlArg is not "" then set url of newEvent to urlArg
+                if allDayArg is "true" then set allday event of newEvent to true
 
-    if all_day:
-        optional_props.append('set allday event of newEvent to true')
+                if attendeesArg is not "" then
+                    set attendeeRecords to {}
+                    repeat with anEmail in paragraphs of attendeesArg
+                        set end of attendeeRecords to {email:(contents of anEmail)}
+                    end repeat
 
-    optional_script = '\n            '.join(optional_props) if optional_props else ''
+                    -- Assign the whole list in one Apple event; Calendar versions
+                    -- that refuse bulk assignment get one make per attendee
+                    try
+                        set attendees of newEvent to attendeeRecords
+                    on error
+                        repeat with attendeeRecord in attendeeRecords
+                            make new attendee at end of attendees of newEvent with properties (contents of attendeeRecord)
+                        end repeat
+                    end try
+                end if
 
-    # Handle attendees
-    attendee_script = ''
-    if attendees:
-        attendee_lines = []
-        for email in attendees:
-            attendee_lines.append(f'make new attendee at end of attendees of newEvent with properties {{email:"{email}"}}')
-        attendee_script = '\n            '.join(attendee_lines)
+                if alertArg is not "" then
+                    make new display alarm at end of display alarms of newEvent with properties {trigger interval:-((alertArg as integer) * 60)}
+                end if
+            end tell
 
-    # Handle alerts
-    alert_script = ''
-    if alert_minutes is not None:
-        alert_script = f'make new display alarm at end of display alarms of newEvent with properties {{trigger interval:{-alert_minutes * 60}}}'
+            save
 
-    script = f'''
-    tell application "Calendar"
-        set targetCal to calendar "{calendar}"
+            -- Read back once: making the event all-day can move its dates
+            set evtProps to properties of newEvent
+            set eventStart to start date of evtProps
 
-        tell targetCal
-            set newEvent to make new event with properties {{summary:"{title}", start date:date "{start_formatted}", end date:date "{end_formatted}"}}
+            set outputText to "✅ EVENT CREATED" & return & return
+            set outputText to outputText & "📌 " & titleArg & return
+            set outputText to outputText & "📅 " & date string of eventStart & return
 
-            {optional_script}
+            if allday event of evtProps then
+                set outputText to outputText & "🕐 All Day Event" & return
+            else
+                set outputText to outputText & "🕐 " & time string of eventStart & " - " & time string of (end date of evtProps) & return
+            end if
 
-            {attendee_script}
+            set outputText to outputText & "📁 Calendar: " & calArg & return
 
-            {alert_script}
+            return outputText
         end tell
-
-        save
-
-        set outputText to "✅ EVENT CREATED" & return & return
-        set outputText to outputText & "📌 " & "{title}" & return
-        set outputText to outputText & "📅 " & date string of start date of newEvent & return
-
-        if allday event of newEvent then
-            set outputText to outputText & "🕐 All Day Event" & return
-        else
-            set outputText to outputText & "🕐 " & time string of start date of newEvent & " - " & time string of end date of newEvent & return
-        end if
-
-        set outputText to outputText & "📁 Calendar: {calendar}" & return
-
-        return outputText
-    end tell
+    end run
     '''
 
-    result = run_applescript(script)
+    result = await run_applescript(
+        script,
+        calendar,
+        title,
+        start_formatted,
+        end_formatted,
+        location or "",
+        notes or "",
+        url or "",
+        applescript_bool(all_day),
+        "\n".join(attendees or []),
+        str(alert_minutes) if alert_minutes is not None else ""
+    )
+    RESULT_CACHE.clear()
     return result
 
 
 @mcp.tool()
 @inject_preferences
-def create_recurring_event(
+async def create_recurring_event(
     calendar: str,
     title: str,
     start_date: str,
@@ -641,71 +1817,69 @@ def create_recurring_event(
     start_formatted = format_applescript_date(start_date)
     end_formatted = format_applescript_date(end_date)
 
-    # Map frequency to AppleScript recurrence
-    freq_map = {
-        "daily": "day",
-        "weekly": "week",
-        "monthly": "month",
-        "yearly": "year"
-    }
-
-    freq_unit = freq_map.get(recurrence_frequency.lower(), "week")
-
     # Build recurrence rule
     if recurrence_end_date:
         recurrence_end_formatted = format_applescript_date(recurrence_end_date)
-        recurrence_rule = f'"FREQ={recurrence_frequency.upper()};INTERVAL={recurrence_interval};UNTIL={recurrence_end_formatted}"'
+        recurrence_rule = f'FREQ={recurrence_frequency.upper()};INTERVAL={recurrence_interval};UNTIL={recurrence_end_formatted}'
     else:
-        recurrence_rule = f'"FREQ={recurrence_frequency.upper()};INTERVAL={recurrence_interval}"'
-
-    # Build optional properties
-    optional_props = []
-    if location:
-        optional_props.append(f'set location of newEvent to "{location}"')
-    if notes:
-        escaped_notes = notes.replace('"', '\\"')
-        optional_props.append(f'set description of newEvent to "{escaped_notes}"')
-
-    optional_script = '\n            '.join(optional_props) if optional_props else ''
+        recurrence_rule = f'FREQ={recurrence_frequency.upper()};INTERVAL={recurrence_interval}'
 
-    alert_script = ''
-    if alert_minutes is not None:
-        alert_script = f'make new display alarm at end of display alarms of newEvent with properties {{trigger interval:{-alert_minutes * 60}}}'
+    script = '''
+    on run argv
+        set {calArg, titleArg, startArg, endArg, ruleArg, locArg, notesArg, alertArg, freqArg, intervalArg} to argv
+        set startDate to date startArg
+        set endDate to date endArg
 
-    script = f'''
-    tell application "Calendar"
-        set targetCal to calendar "{calendar}"
+        tell application "Calendar"
+            set targetCal to calendar calArg
 
-        tell targetCal
-            set newEvent to make new event with properties {{summary:"{title}", start date:date "{start_formatted}", end date:date "{end_formatted}"}}
+            tell targetCal
+                set newEvent to make new event with properties {summary:titleArg, start date:startDate, end date:endDate}
 
-            {optional_script}
+                if locArg is not "" then set location of newEvent to locArg
+                if notesArg is not "" then set description of newEvent to notesArg
 
-            set recurrence of newEvent to {recurrence_rule}
+                set recurrence of newEvent to ruleArg
 
-            {alert_script}
-        end tell
+                if alertArg is not "" then
+                    make new display alarm at end of display alarms of newEvent with properties {trigger interval:-((alertArg as integer) * 60)}
+                end if
+            end tell
 
-        save
+            save
 
-        set outputText to "✅ RECURRING EVENT CREATED" & return & return
-        set outputText to outputText & "📌 " & "{title}" & return
-        set outputText to outputText & "🔄 Repeats: {recurrence_frequency}, every {recurrence_interval}" & return
-        set outputText to outputText & "📅 Starts: " & date string of start date of newEvent & return
-        set outputText to outputText & "🕐 " & time string of start date of newEvent & " - " & time string of end date of newEvent & return
-        set outputText to outputText & "📁 Calendar: {calendar}" & return
+            set outputText to "✅ RECURRING EVENT CREATED" & return & return
+            set outputText to outputText & "📌 " & titleArg & return
+            set outputText to outputText & "🔄 Repeats: " & freqArg & ", every " & intervalArg & return
+            set outputText to outputText & "📅 Starts: " & date string of startDate & return
+            set outputText to outputText & "🕐 " & time string of startDate & " - " & time string of endDate & return
+            set outputText to outputText & "📁 Calendar: " & calArg & return
 
-        return outputText
-    end tell
+            return outputText
+        end tell
+    end run
     '''
 
-    result = run_applescript(script)
+    result = await run_applescript(
+        script,
+        calendar,
+        title,
+        start_formatted,
+        end_formatted,
+        recurrence_rule,
+        location or "",
+        notes or "",
+        str(alert_minutes) if alert_minutes is not None else "",
+        recurrence_frequency,
+        str(recurrence_interval)
+    )
+    RESULT_CACHE.clear()
     return result
 
 
 @mcp.tool()
 @inject_preferences
-def quick_add_event(
+async def quick_add_event(
     calendar: str,
     event_text: str
 ) -> str:
@@ -729,31 +1903,35 @@ def quick_add_event(
 
     # This is a simplified version - AppleScript doesn't have sophisticated NLP
     # We'll provide a helpful response that guides users to use create_event for now
-    script = f'''
-    tell application "Calendar"
-        set outputText to "⚠️ QUICK ADD GUIDANCE" & return & return
-        set outputText to outputText & "Natural language parsing in AppleScript is limited." & return
-        set outputText to outputText & "Please use create_event with specific parameters:" & return & return
-        set outputText to outputText & "Your input: '{event_text}'" & return & return
-        set outputText to outputText & "Example:" & return
-        set outputText to outputText & "create_event(" & return
-        set outputText to outputText & "  calendar='{calendar}'," & return
-        set outputText to outputText & "  title='Your Event Title'," & return
-        set outputText to outputText & "  start_date='2025-01-15 14:00'," & return
-        set outputText to outputText & "  end_date='2025-01-15 15:00'" & return
-        set outputText to outputText & ")" & return
+    script = '''
+    on run argv
+        set {calArg, textArg} to argv
 
-        return outputText
-    end tell
+        tell application "Calendar"
+            set outputText to "⚠️ QUICK ADD GUIDANCE" & return & return
+            set outputText to outputText & "Natural language parsing in AppleScript is limited." & return
+            set outputText to outputText & "Please use create_event with specific parameters:" & return & return
+            set outputText to outputText & "Your input: '" & textArg & "'" & return & return
+            set outputText to outputText & "Example:" & return
+            set outputText to outputText & "create_event(" & return
+            set outputText to outputText & "  calendar='" & calArg & "'," & return
+            set outputText to outputText & "  title='Your Event Title'," & return
+            set outputText to outputText & "  start_date='2025-01-15 14:00'," & return
+            set outputText to outputText & "  end_date='2025-01-15 15:00'" & return
+            set outputText to outputText & ")" & return
+
+            return outputText
+        end tell
+    end run
     '''
 
-    result = run_applescript(script)
+    result = await run_applescript(script, calendar, event_text)
     return result
 
 
 @mcp.tool()
 @inject_preferences
-def update_event(
+async def update_event(
     calendar: str,
     event_title: str,
     start_date: Optional[str] = None,
@@ -782,83 +1960,85 @@ def update_event(
         Success message with updated event details
     """
 
-    # Find event first
-    date_filter = ''
-    if start_date:
-        date_filter = f'''
-            set searchDate to date "{format_applescript_date(start_date)}"
+    # Empty arguments leave the corresponding property untouched
+    script = '''
+    on run argv
+        set {calArg, titleArg, dateArg, newTitleArg, newStartArg, newEndArg, newLocArg, newNotesArg, newUrlArg} to argv
+        if dateArg is not "" then
+            set searchDate to date dateArg
             set searchEndDate to searchDate + 1 * days
-            set matchingEvents to (every event of targetCal whose summary contains "{event_title}" and start date >= searchDate and start date < searchEndDate)
-        '''
-    else:
-        date_filter = f'''
-            set matchingEvents to (every event of targetCal whose summary contains "{event_title}")
-        '''
-
-    # Build update statements
-    updates = []
-    if new_title:
-        updates.append(f'set summary of targetEvent to "{new_title}"')
-    if new_start_date:
-        updates.append(f'set start date of targetEvent to date "{format_applescript_date(new_start_date)}"')
-    if new_end_date:
-        updates.append(f'set end date of targetEvent to date "{format_applescript_date(new_end_date)}"')
-    if new_location:
-        updates.append(f'set location of targetEvent to "{new_location}"')
-    if new_notes:
-        escaped_notes = new_notes.replace('"', '\\"')
-        updates.append(f'set description of targetEvent to "{escaped_notes}"')
-    if new_url:
-        updates.append(f'set url of targetEvent to "{new_url}"')
-
-    update_script = '\n            '.join(updates) if updates else ''
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "EVENT UPDATE" & return & return
+        end if
+        if newStartArg is not "" then set newStartDate to date newStartArg
+        if newEndArg is not "" then set newEndDate to date newEndArg
 
-        try
-            set targetCal to calendar "{calendar}"
-            {date_filter}
+        tell application "Calendar"
+            try
+                set targetCal to calendar calArg
 
-            if (count of matchingEvents) = 0 then
-                return "❌ No event found matching: {event_title}"
-            end if
+                -- "first event" lets Calendar stop at the first match
+                try
+                    if dateArg is "" then
+                        set targetEvent to first event of targetCal whose summary contains titleArg
+                    else
+                        set targetEvent to first event of targetCal whose summary contains titleArg and start date >= searchDate and start date < searchEndDate
+                    end if
+                on error
+                    return "❌ No event found matching: " & titleArg
+                end try
 
-            set targetEvent to item 1 of matchingEvents
+                if newTitleArg is not "" then set summary of targetEvent to newTitleArg
+                if newStartArg is not "" then set start date of targetEvent to newStartDate
+                if newEndArg is not "" then set end date of targetEvent to newEndDate
+                if newLocArg is not "" then set location of targetEvent to newLocArg
+                if newNotesArg is not "" then set description of targetEvent to newNotesArg
+                if newUrlArg is not "" then set url of targetEvent to newUrlArg
 
-            {update_script}
+                save
 
-            save
+                set evtProps to properties of targetEvent
+                set eventStart to start date of evtProps
 
-            set outputText to "✅ EVENT UPDATED" & return & return
-            set outputText to outputText & "📌 " & summary of targetEvent & return
-            set outputText to outputText & "📅 " & date string of start date of targetEvent & return
-            set outputText to outputText & "🕐 " & time string of start date of targetEvent & " - " & time string of end date of targetEvent & return
-            set outputText to outputText & "📁 Calendar: {calendar}" & return
+                set outputText to "✅ EVENT UPDATED" & return & return
+                set outputText to outputText & "📌 " & summary of evtProps & return
+                set outputText to outputText & "📅 " & date string of eventStart & return
+                set outputText to outputText & "🕐 " & time string of eventStart & " - " & time string of (end date of evtProps) & return
+                set outputText to outputText & "📁 Calendar: " & calArg & return
 
-            try
-                set evtLoc to location of targetEvent
-                if evtLoc is not missing value and length of evtLoc > 0 then
-                    set outputText to outputText & "📍 Location: " & evtLoc & return
-                end if
-            end try
+                try
+                    set evtLoc to location of evtProps
+                    if evtLoc is not missing value and evtLoc is not "" then
+                        set outputText to outputText & "📍 Location: " & evtLoc & return
+                    end if
+                end try
 
-            return outputText
+                return outputText
 
-        on error errMsg
-            return "❌ Error updating event: " & errMsg
-        end try
-    end tell
+            on error errMsg
+                return "❌ Error updating event: " & errMsg
+            end try
+        end tell
+    end run
     '''
 
-    result = run_applescript(script)
+    result = await run_applescript(
+        script,
+        calendar,
+        event_title,
+        format_applescript_date(start_date) if start_date else "",
+        new_title or "",
+        format_applescript_date(new_start_date) if new_start_date else "",
+        format_applescript_date(new_end_date) if new_end_date else "",
+        new_location or "",
+        new_notes or "",
+        new_url or ""
+    )
+    RESULT_CACHE.clear()
     return result
 
 
 @mcp.tool()
 @inject_preferences
-def move_event(
+async def move_event(
     calendar: str,
     event_title: str,
     current_start_date: str,
@@ -879,71 +2059,90 @@ def move_event(
         Success message with rescheduled event details
     """
 
-    current_formatted = format_applescript_date(current_start_date)
-    new_start_formatted = format_applescript_date(new_start_date)
-
-    # Handle end date
-    end_date_script = ''
-    if new_end_date:
-        new_end_formatted = format_applescript_date(new_end_date)
-        end_date_script = f'set end date of targetEvent to date "{new_end_formatted}"'
-    else:
-        # Preserve duration
-        end_date_script = '''
-            set eventDuration to (end date of targetEvent) - (start date of targetEvent)
-            set end date of targetEvent to (date newStartDate) + eventDuration
-        '''
-
     script = f'''
-    tell application "Calendar"
-        set outputText to "MOVE EVENT" & return & return
+    on run argv
+        set {{calArg, titleArg, searchArg, dateLabel, newStartArg, newEndArg}} to argv
 
         try
-            set targetCal to calendar "{calendar}"
-            set searchDate to date "{current_formatted}"
+            set searchDate to date searchArg
             set searchEndDate to searchDate + 1 * days
+            set newStartDate to date newStartArg
+            if newEndArg is not "" then set newEndDate to date newEndArg
+        on error errMsg
+            return "❌ Error moving event: " & errMsg
+        end try
 
-            set matchingEvents to (every event of targetCal whose summary contains "{event_title}" and start date >= searchDate and start date < searchEndDate)
-
-            if (count of matchingEvents) = 0 then
-                return "❌ No event found matching: {event_title} on {current_start_date}"
-            end if
-
-            set targetEvent to item 1 of matchingEvents
-            set oldStart to start date of targetEvent
-            set oldEnd to end date of targetEvent
+        tell application "Calendar"
+            try
+                set targetCal to calendar calArg
 
-            set newStartDate to "{new_start_formatted}"
-            set start date of targetEvent to date newStartDate
+                -- "first event" lets Calendar stop at the first match
+                try
+                    set targetEvent to first event of targetCal whose summary contains titleArg and start date >= searchDate and start date < searchEndDate
+                on error
+                    return "❌ No event found matching: " & titleArg & " on " & dateLabel
+                end try
+                set oldStart to start date of targetEvent
+                set oldEnd to end date of targetEvent
 
-            {end_date_script}
+                set eventTitle to summary of targetEvent
 
-            save
+                if newEndArg is "" then
+                    -- Preserve duration
+                    set newEndDate to newStartDate + (oldEnd - oldStart)
+                end if
+                set start date of targetEvent to newStartDate
+                set end date of targetEvent to newEndDate
 
-            set outputText to "✅ EVENT MOVED" & return & return
-            set outputText to outputText & "📌 " & summary of targetEvent & return & return
-            set outputText to outputText & "FROM:" & return
-            set outputText to outputText & "  📅 " & date string of oldStart & return
-            set outputText to outputText & "  🕐 " & time string of oldStart & " - " & time string of oldEnd & return & return
-            set outputText to outputText & "TO:" & return
-            set outputText to outputText & "  📅 " & date string of start date of targetEvent & return
-            set outputText to outputText & "  🕐 " & time string of start date of targetEvent & " - " & time string of end date of targetEvent & return
+                save
 
-            return outputText
+                -- One record: title, old start, old end, new start, new end
+                set AppleScript's text item delimiters to character id 31
+                set outputText to {{eventTitle, my isoDate(oldStart), my isoDate(oldEnd), my isoDate(newStartDate), my isoDate(newEndDate)}} as text
+                set AppleScript's text item delimiters to ""
+                return outputText
 
-        on error errMsg
-            return "❌ Error moving event: " & errMsg
-        end try
-    end tell
+            on error errMsg
+                return "❌ Error moving event: " & errMsg
+            end try
+        end tell
+    end run
+    {ISO_DATE_HANDLER}
     '''
 
-    result = run_applescript(script)
-    return result
+    result = await run_applescript(
+        script,
+        calendar,
+        event_title,
+        format_applescript_date(current_start_date),
+        current_start_date,
+        format_applescript_date(new_start_date),
+        format_applescript_date(new_end_date) if new_end_date else ""
+    )
+    RESULT_CACHE.clear()
+    if result.startswith("❌"):
+        return result
+
+    title, *dates = split_records(result, 5)[0]
+    old_start, old_end, new_start, new_end = map(datetime.fromisoformat, dates)
+    return "\n".join([
+        "✅ EVENT MOVED",
+        "",
+        f"📌 {title}",
+        "",
+        "FROM:",
+        f"  📅 {applescript_date_string(old_start)}",
+        f"  🕐 {applescript_time_string(old_start)} - {applescript_time_string(old_end)}",
+        "",
+        "TO:",
+        f"  📅 {applescript_date_string(new_start)}",
+        f"  🕐 {applescript_time_string(new_start)} - {applescript_time_string(new_end)}"
+    ])
 
 
 @mcp.tool()
 @inject_preferences
-def delete_event(
+async def delete_event(
     calendar: str,
     event_title: str,
     start_date: str,
@@ -956,7 +2155,7 @@ def delete_event(
         calendar: Calendar name containing the event
         event_title: Event title to search for
         start_date: Start date of the event to delete (YYYY-MM-DD format)
-        delete_all_occurrences: For recurring events, delete all occurrences (default: False, deletes only this instance)
+        delete_all_occurrences: Accepted for compatibility; Calendar's scripting interface always deletes the whole series of a recurring event
 
     Returns:
         Success message confirming deletion
@@ -964,68 +2163,72 @@ def delete_event(
 
     date_formatted = format_applescript_date(start_date)
 
-    # Recurrence handling
-    if delete_all_occurrences:
-        delete_cmd = 'delete targetEvent'
-    else:
-        delete_cmd = 'delete targetEvent'
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "DELETE EVENT" & return & return
+    # Calendar deletes the whole series either way, so the script is the
+    # same for both values of delete_all_occurrences
+    script = '''
+    on run argv
+        set {calArg, titleArg, searchArg, dateLabel} to argv
 
         try
-            set targetCal to calendar "{calendar}"
-            set searchDate to date "{date_formatted}"
+            set searchDate to date searchArg
             set searchEndDate to searchDate + 1 * days
+        on error errMsg
+            return "❌ Error deleting event: " & errMsg
+        end try
 
-            set matchingEvents to (every event of targetCal whose summary contains "{event_title}" and start date >= searchDate and start date < searchEndDate)
-
-            if (count of matchingEvents) = 0 then
-                return "❌ No event found matching: {event_title} on {start_date}"
-            end if
+        tell application "Calendar"
+            try
+                set targetCal to calendar calArg
 
-            set targetEvent to item 1 of matchingEvents
-            set eventTitle to summary of targetEvent
+                -- "first event" lets Calendar stop at the first match
+                try
+                    set targetEvent to first event of targetCal whose summary contains titleArg and start date >= searchDate and start date < searchEndDate
+                on error
+                    return "❌ No event found matching: " & titleArg & " on " & dateLabel
+                end try
+                set evtProps to properties of targetEvent
+                set eventTitle to summary of evtProps
 
-            -- Try to get date/time info before deletion
-            set eventDateStr to "{start_date}"
-            set eventTimeStr to ""
-            try
-                set eventStartDate to start date of targetEvent
-                set eventDateStr to date string of eventStartDate
-                if allday event of targetEvent is false then
-                    set eventTimeStr to time string of eventStartDate
-                end if
-            end try
+                -- Try to get date/time info before deletion
+                set eventDateStr to dateLabel
+                set eventTimeStr to ""
+                try
+                    set eventStartDate to start date of evtProps
+                    set eventDateStr to date string of eventStartDate
+                    if allday event of evtProps is false then
+                        set eventTimeStr to time string of eventStartDate
+                    end if
+                end try
 
-            {delete_cmd}
+                delete targetEvent
 
-            save
+                save
 
-            set outputText to "✅ EVENT DELETED" & return & return
-            set outputText to outputText & "📌 " & eventTitle & return
-            set outputText to outputText & "📅 " & eventDateStr & return
-            if eventTimeStr is not "" then
-                set outputText to outputText & "🕐 " & eventTimeStr & return
-            end if
-            set outputText to outputText & "📁 Calendar: {calendar}" & return
+                set outputText to "✅ EVENT DELETED" & return & return
+                set outputText to outputText & "📌 " & eventTitle & return
+                set outputText to outputText & "📅 " & eventDateStr & return
+                if eventTimeStr is not "" then
+                    set outputText to outputText & "🕐 " & eventTimeStr & return
+                end if
+                set outputText to outputText & "📁 Calendar: " & calArg & return
 
-            return outputText
+                return outputText
 
-        on error errMsg
-            return "❌ Error deleting event: " & errMsg
-        end try
-    end tell
+            on error errMsg
+                return "❌ Error deleting event: " & errMsg
+            end try
+        end tell
+    end run
     '''
 
-    result = run_applescript(script)
+    result = await run_applescript(script, calendar, event_title, date_formatted, start_date)
+    RESULT_CACHE.clear()
     return result
 
 
 @mcp.tool()
 @inject_preferences
-def manage_reminders(
+async def manage_reminders(
     calendar: str,
     event_title: str,
     start_date: str,
@@ -1048,73 +2251,87 @@ def manage_reminders(
 
     date_formatted = format_applescript_date(start_date)
 
-    # Build reminder creation script
-    reminder_script = ''
-    if reminder_minutes:
-        reminder_lines = []
-        for minutes in reminder_minutes:
-            seconds = -minutes * 60
-            reminder_lines.append(f'make new display alarm at end of display alarms of targetEvent with properties {{trigger interval:{seconds}}}')
-        reminder_script = '\n            '.join(reminder_lines)
-
-    clear_script = ''
-    if clear_existing:
-        clear_script = 'delete every display alarm of targetEvent'
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "MANAGE REMINDERS" & return & return
+    # Reminder minutes travel as one argument, one value per line
+    script = '''
+    on run argv
+        set {calArg, titleArg, searchArg, dateLabel, minutesArg, clearExisting} to argv
 
         try
-            set targetCal to calendar "{calendar}"
-            set searchDate to date "{date_formatted}"
+            set searchDate to date searchArg
             set searchEndDate to searchDate + 1 * days
+        on error errMsg
+            return "❌ Error managing reminders: " & errMsg
+        end try
 
-            set matchingEvents to (every event of targetCal whose summary contains "{event_title}" and start date >= searchDate and start date < searchEndDate)
+        tell application "Calendar"
+            try
+                set targetCal to calendar calArg
 
-            if (count of matchingEvents) = 0 then
-                return "❌ No event found matching: {event_title} on {start_date}"
-            end if
+                -- "first event" lets Calendar stop at the first match
+                try
+                    set targetEvent to first event of targetCal whose summary contains titleArg and start date >= searchDate and start date < searchEndDate
+                on error
+                    return "❌ No event found matching: " & titleArg & " on " & dateLabel
+                end try
 
-            set targetEvent to item 1 of matchingEvents
+                if clearExisting is "true" then delete every display alarm of targetEvent
 
-            {clear_script}
+                if minutesArg is not "" then
+                    repeat with minutesText in paragraphs of minutesArg
+                        make new display alarm at end of display alarms of targetEvent with properties {trigger interval:-((minutesText as integer) * 60)}
+                    end repeat
+                end if
 
-            {reminder_script}
+                save
 
-            save
+                set outputText to "✅ REMINDERS UPDATED" & return & return
+                set evtProps to properties of targetEvent
+                set outputText to outputText & "📌 " & summary of evtProps & return
+                set outputText to outputText & "📅 " & date string of (start date of evtProps) & return & return
 
-            set outputText to "✅ REMINDERS UPDATED" & return & return
-            set outputText to outputText & "📌 " & summary of targetEvent & return
-            set outputText to outputText & "📅 " & date string of start date of targetEvent & return & return
-
-            set alarmList to display alarms of targetEvent
-            if (count of alarmList) > 0 then
-                set outputText to outputText & "⏰ Active Reminders:" & return
-                repeat with anAlarm in alarmList
-                    set triggerInterval to trigger interval of anAlarm
-                    set minutesBefore to (triggerInterval / -60) as integer
-                    set outputText to outputText & "   • " & minutesBefore & " minutes before" & return
-                end repeat
-            else
-                set outputText to outputText & "No reminders set" & return
-            end if
+                set alarmList to display alarms of targetEvent
+                if (count of alarmList) > 0 then
+                    set outputText to outputText & "⏰ Active Reminders:" & return
+                    repeat with anAlarm in alarmList
+                        set triggerInterval to trigger interval of anAlarm
+                        set minutesBefore to (triggerInterval / -60) as integer
+                        set outputText to outputText & "   • " & minutesBefore & " minutes before" & return
+                    end repeat
+                else
+                    set outputText to outputText & "No reminders set" & return
+                end if
 
-            return outputText
+                return outputText
 
-        on error errMsg
-            return "❌ Error managing reminders: " & errMsg
-        end try
-    end tell
+            on error errMsg
+                return "❌ Error managing reminders: " & errMsg
+            end try
+        end tell
+    end run
     '''
 
-    result = run_applescript(script)
+    result = await run_applescript(
+        script,
+        calendar,
+        event_title,
+        date_formatted,
+        start_date,
+        "\n".join(str(minutes) for minutes in reminder_minutes or ()),
+        applescript_bool(clear_existing)
+    )
+    RESULT_CACHE.clear()
     return result
 
 
+# Default search window around today when search_events gets no dates
+SEARCH_DAYS_BEHIND = 30
+SEARCH_DAYS_AHEAD = 90
+
+
 @mcp.tool()
 @inject_preferences
-def search_events(
+@cached_result(ttl=READ_CACHE_TTL)
+async def search_events(
     search_text: str,
     calendar: Optional[str] = None,
     start_date: Optional[str] = None,
@@ -1129,8 +2346,8 @@ def search_events(
     Args:
         search_text: Text to search for in event titles (and optionally location/notes)
         calendar: Optional calendar name to search in (if None, searches all calendars)
-        start_date: Optional start of date range (YYYY-MM-DD format)
-        end_date: Optional end of date range (YYYY-MM-DD format)
+        start_date: Optional start of date range (YYYY-MM-DD or YYYY-MM-DD HH:MM only, default: 30 days ago)
+        end_date: Optional end of date range (YYYY-MM-DD or YYYY-MM-DD HH:MM only, default: 90 days from now)
         search_location: Whether to also search in event locations (default: False)
         search_notes: Whether to also search in event notes (default: False)
         max_results: Maximum number of results to return (default: 20)
@@ -1139,129 +2356,60 @@ def search_events(
         List of matching events with details
     """
 
-    date_range_script = get_date_range_script(start_date, end_date, days_ahead=365)
-
-    calendar_filter = f'''
-        set targetCalendars to {{calendar "{calendar}"}}
-    ''' if calendar else '''
-        set targetCalendars to every calendar
-    '''
-
-    # Build search filters
-    search_conditions = [f'summary of anEvent contains "{search_text}"']
-
-    if search_location:
-        # Location search will be done in a try block in the main script
-        pass
-
-    if search_notes:
-        # Notes search will be done in a try block in the main script
-        pass
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "SEARCH RESULTS" & return & return
-        set outputText to outputText & "Search term: '{search_text}'" & return
-        {date_range_script}
-        set outputText to outputText & "Date range: " & (startDate as string) & " to " & (endDate as string) & return
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
-
-        {calendar_filter}
-
-        set resultCount to 0
-        set matchedEvents to {{}}
-
-        repeat with aCal in targetCalendars
-            set calName to name of aCal
-
-            try
-                set calEvents to (every event of aCal whose start date >= startDate and start date <= endDate)
-
-                repeat with anEvent in calEvents
-                    if resultCount >= {max_results} then exit repeat
-
-                    set isMatch to false
-
-                    -- Check title
-                    if summary of anEvent contains "{search_text}" then
-                        set isMatch to true
-                    end if
-
-                    -- Check location if requested
-                    {"" if not search_location else f'''
-                    if not isMatch then
-                        try
-                            set evtLoc to location of anEvent
-                            if evtLoc is not missing value and evtLoc contains "{search_text}" then
-                                set isMatch to true
-                            end if
-                        end try
-                    end if
-                    '''}
-
-                    -- Check notes if requested
-                    {"" if not search_notes else f'''
-                    if not isMatch then
-                        try
-                            set evtNotes to description of anEvent
-                            if evtNotes is not missing value and evtNotes contains "{search_text}" then
-                                set isMatch to true
-                            end if
-                        end try
-                    end if
-                    '''}
-
-                    if isMatch then
-                        try
-                            set eventTitle to summary of anEvent
-                            set eventStart to start date of anEvent
-                            set eventEnd to end date of anEvent
-                            set isAllDay to allday event of anEvent
-
-                            if isAllDay then
-                                set timeStr to "All Day"
-                            else
-                                set timeStr to time string of eventStart & " - " & time string of eventEnd
-                            end if
-
-                            set outputText to outputText & "📌 " & eventTitle & return
-                            set outputText to outputText & "   📅 " & date string of eventStart & return
-                            set outputText to outputText & "   🕐 " & timeStr & return
-                            set outputText to outputText & "   📁 " & calName & return
-
-                            try
-                                set evtLoc to location of anEvent
-                                if evtLoc is not missing value and length of evtLoc > 0 then
-                                    set outputText to outputText & "   📍 " & evtLoc & return
-                                end if
-                            end try
-
-                            set outputText to outputText & return
-                            set resultCount to resultCount + 1
-                        end try
-                    end if
-                end repeat
-            end try
-        end repeat
-
-        if resultCount = 0 then
-            set outputText to outputText & "No events found matching your search." & return
-        else
-            set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return
-            set outputText to outputText & "Total: " & resultCount & " matching event(s)" & return
-        end if
-
-        return outputText
-    end tell
-    '''
+    # Unbounded searches cover a window around today rather than a whole year
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    range_start = parse_date_arg(start_date) if start_date else today - timedelta(days=SEARCH_DAYS_BEHIND)
+    range_end = parse_date_arg(end_date) if end_date else today + timedelta(days=SEARCH_DAYS_AHEAD)
+
+    matches = await fetch_events(
+        range_start.strftime(DATETIME_INPUT_FORMAT),
+        range_end.strftime(DATETIME_INPUT_FORMAT),
+        calendar,
+        include_notes=search_notes,
+        search_text=search_text,
+        search_location=search_location,
+        search_notes=search_notes,
+        limit=max_results
+    )
+
+    output_lines = [
+        "SEARCH RESULTS",
+        "",
+        f"Search term: '{search_text}'",
+        f"Date range: {applescript_date_string(range_start)} at {applescript_time_string(range_start)}"
+        f" to {applescript_date_string(range_end)} at {applescript_time_string(range_end)}",
+        SEPARATOR_LINE,
+        ""
+    ]
+    output_lines.extend(format_event_list(matches))
+
+    if matches:
+        output_lines.append(SEPARATOR_LINE)
+        output_lines.append(f"Total: {len(matches)} matching event(s)")
+    else:
+        output_lines.append("No events found matching your search.")
+
+    # Name only the bounds that were defaulted, with the dates they resolved to
+    defaulted = []
+    missing_args = []
+    if not start_date:
+        defaulted.append(f"start {applescript_date_string(range_start)} ({SEARCH_DAYS_BEHIND} days back)")
+        missing_args.append("start_date")
+    if not end_date:
+        defaulted.append(f"end {applescript_date_string(range_end)} ({SEARCH_DAYS_AHEAD} days ahead)")
+        missing_args.append("end_date")
+    if defaulted:
+        output_lines.append(
+            f"⚠️ Searched with default {' and '.join(defaulted)}; pass {' and '.join(missing_args)} to widen"
+        )
 
-    result = run_applescript(script)
-    return result
+    return "\n".join(output_lines)
 
 
 @mcp.tool()
 @inject_preferences
-def find_free_time(
+@cached_result(ttl=READ_CACHE_TTL)
+async def find_free_time(
     start_date: str,
     end_date: str,
     duration_minutes: int = 30,
@@ -1273,8 +2421,8 @@ def find_free_time(
     Find available time slots for scheduling new events.
 
     Args:
-        start_date: Start of search range (YYYY-MM-DD format)
-        end_date: End of search range (YYYY-MM-DD format)
+        start_date: Start of search range (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
+        end_date: End of search range (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
         duration_minutes: Required duration in minutes (default: 30)
         calendar: Optional calendar name to check (if None, checks all calendars)
         business_hours_only: Only suggest slots during business hours 9am-5pm (default: True)
@@ -1284,111 +2432,43 @@ def find_free_time(
         List of available time slots
     """
 
-    start_formatted = format_applescript_date(start_date)
-    end_formatted = format_applescript_date(end_date)
-
-    calendar_filter = f'''
-        set targetCalendars to {{calendar "{calendar}"}}
-    ''' if calendar else '''
-        set targetCalendars to every calendar
-    '''
-
-    # Business hours filter
-    business_hours_check = '''
-                    -- Check if within business hours (9 AM to 5 PM)
-                    set slotHour to hours of currentSlot
-                    if slotHour < 9 or slotHour >= 17 then
-                        set currentSlot to currentSlot + (60 * minutes)
-                        set iteration to iteration + 1
-                    end if
-    ''' if business_hours_only else ''
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "FREE TIME SLOTS" & return & return
-        set outputText to outputText & "Duration needed: {duration_minutes} minutes" & return
-        set outputText to outputText & "Search range: {start_date} to {end_date}" & return
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
-
-        set searchStart to date "{start_formatted}"
-        set searchEnd to date "{end_formatted}"
-        set slotDuration to {duration_minutes} * minutes
-
-        {calendar_filter}
-
-        -- Collect all busy times
-        set busySlots to {{}}
-
-        repeat with aCal in targetCalendars
-            try
-                set calEvents to (every event of aCal whose start date >= searchStart and start date <= searchEnd and allday event is false)
-
-                repeat with anEvent in calEvents
-                    set eventStart to start date of anEvent
-                    set eventEnd to end date of anEvent
-                    set end of busySlots to {{eventStart, eventEnd}}
-                end repeat
-            end try
-        end repeat
-
-        -- Find free slots
-        set freeSlots to {{}}
-        set currentSlot to searchStart
-        set suggestionsFound to 0
-        set maxIterations to 1000
-        set iteration to 0
-
-        repeat while currentSlot < searchEnd and suggestionsFound < {max_suggestions} and iteration < maxIterations
-            {business_hours_check}
-
-            set slotEnd to currentSlot + slotDuration
-            set isFree to true
-
-            -- Check if this slot conflicts with any busy time
-            repeat with busyTime in busySlots
-                set busyStart to item 1 of busyTime
-                set busyEnd to item 2 of busyTime
-
-                -- Check for overlap
-                if (currentSlot < busyEnd) and (slotEnd > busyStart) then
-                    set isFree to false
-                    set currentSlot to busyEnd
-                    exit repeat
-                end if
-            end repeat
+    search_start = parse_date_arg(start_date)
+    search_end = parse_date_arg(end_date)
+    slot_duration = timedelta(minutes=duration_minutes)
 
-            if isFree and slotEnd <= searchEnd then
-                set outputText to outputText & "✅ " & date string of currentSlot & return
-                set outputText to outputText & "   🕐 " & time string of currentSlot & " - " & time string of slotEnd & return
-                set outputText to outputText & "   ⏱  Duration: {duration_minutes} minutes" & return & return
+    # One batched read, then a single sorted, merged list of busy intervals
+    busy = merge_busy_intervals(await fetch_events(start_date, end_date, calendar))
 
-                set suggestionsFound to suggestionsFound + 1
-                set currentSlot to slotEnd
-            else
-                set currentSlot to currentSlot + (30 * minutes)
-            end if
+    output_lines = [
+        "FREE TIME SLOTS",
+        "",
+        f"Duration needed: {duration_minutes} minutes",
+        f"Search range: {start_date} to {end_date}",
+        SEPARATOR_LINE,
+        ""
+    ]
 
-            set iteration to iteration + 1
-        end repeat
+    slots = find_free_slots(busy, search_start, search_end, slot_duration, business_hours_only, max_suggestions)
 
-        if suggestionsFound = 0 then
-            set outputText to outputText & "❌ No free slots found in the specified range." & return
-        else
-            set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return
-            set outputText to outputText & "Found " & suggestionsFound & " available time slot(s)" & return
-        end if
+    for slot_start, slot_end in slots:
+        output_lines.append(f"✅ {applescript_date_string(slot_start)}")
+        output_lines.append(f"   🕐 {applescript_time_string(slot_start)} - {applescript_time_string(slot_end)}")
+        output_lines.append(f"   ⏱  Duration: {duration_minutes} minutes")
+        output_lines.append("")
 
-        return outputText
-    end tell
-    '''
+    if not slots:
+        output_lines.append("❌ No free slots found in the specified range.")
+    else:
+        output_lines.append(SEPARATOR_LINE)
+        output_lines.append(f"Found {len(slots)} available time slot(s)")
 
-    result = run_applescript(script)
-    return result
+    return "\n".join(output_lines)
 
 
 @mcp.tool()
 @inject_preferences
-def detect_conflicts(
+@cached_result(ttl=READ_CACHE_TTL)
+async def detect_conflicts(
     start_date: str,
     end_date: str,
     calendar: Optional[str] = None
@@ -1397,108 +2477,31 @@ def detect_conflicts(
     Detect overlapping/conflicting events in your calendar.
 
     Args:
-        start_date: Start of date range to check (YYYY-MM-DD format)
-        end_date: End of date range to check (YYYY-MM-DD format)
+        start_date: Start of date range to check (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
+        end_date: End of date range to check (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
         calendar: Optional calendar name to check (if None, checks all calendars)
 
     Returns:
         List of conflicting events
     """
 
-    start_formatted = format_applescript_date(start_date)
-    end_formatted = format_applescript_date(end_date)
-
-    calendar_filter = f'''
-        set targetCalendars to {{calendar "{calendar}"}}
-    ''' if calendar else '''
-        set targetCalendars to every calendar
-    '''
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "CONFLICT DETECTION" & return & return
-        set outputText to outputText & "Date range: {start_date} to {end_date}" & return
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
-
-        set searchStart to date "{start_formatted}"
-        set searchEnd to date "{end_formatted}"
-
-        {calendar_filter}
-
-        -- Collect all events
-        set allEvents to {{}}
-
-        repeat with aCal in targetCalendars
-            set calName to name of aCal
-            try
-                set calEvents to (every event of aCal whose start date >= searchStart and start date <= searchEnd and allday event is false)
-
-                repeat with anEvent in calEvents
-                    set eventInfo to {{anEvent, calName}}
-                    set end of allEvents to eventInfo
-                end repeat
-            end try
-        end repeat
-
-        -- Find conflicts
-        set conflictCount to 0
-        set checkedPairs to {{}}
-
-        repeat with i from 1 to (count of allEvents)
-            set event1Info to item i of allEvents
-            set event1 to item 1 of event1Info
-            set cal1 to item 2 of event1Info
-
-            repeat with j from (i + 1) to (count of allEvents)
-                set event2Info to item j of allEvents
-                set event2 to item 1 of event2Info
-                set cal2 to item 2 of event2Info
-
-                set start1 to start date of event1
-                set end1 to end date of event1
-                set start2 to start date of event2
-                set end2 to end date of event2
+    events = await fetch_events(start_date, end_date, calendar)
 
-                -- Check for overlap
-                if (start1 < end2) and (end1 > start2) then
-                    set conflictCount to conflictCount + 1
-
-                    set outputText to outputText & "⚠️  CONFLICT #" & conflictCount & return & return
-
-                    set outputText to outputText & "Event 1:" & return
-                    set outputText to outputText & "  📌 " & summary of event1 & return
-                    set outputText to outputText & "  📅 " & date string of start1 & return
-                    set outputText to outputText & "  🕐 " & time string of start1 & " - " & time string of end1 & return
-                    set outputText to outputText & "  📁 " & cal1 & return & return
-
-                    set outputText to outputText & "Event 2:" & return
-                    set outputText to outputText & "  📌 " & summary of event2 & return
-                    set outputText to outputText & "  📅 " & date string of start2 & return
-                    set outputText to outputText & "  🕐 " & time string of start2 & " - " & time string of end2 & return
-                    set outputText to outputText & "  📁 " & cal2 & return
-
-                    set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
-                end if
-            end repeat
-        end repeat
-
-        if conflictCount = 0 then
-            set outputText to outputText & "✅ No conflicts found!" & return
-        else
-            set outputText to outputText & "Total conflicts: " & conflictCount & return
-        end if
-
-        return outputText
-    end tell
-    '''
-
-    result = run_applescript(script)
-    return result
+    output_lines = [
+        "CONFLICT DETECTION",
+        "",
+        f"Date range: {start_date} to {end_date}",
+        SEPARATOR_LINE,
+        ""
+    ]
+    output_lines.extend(format_conflicts(find_conflicts(events)))
+    return "\n".join(output_lines)
 
 
 @mcp.tool()
 @inject_preferences
-def get_statistics(
+@cached_result(ttl=READ_CACHE_TTL)
+async def get_statistics(
     start_date: str,
     end_date: str,
     calendar: Optional[str] = None
@@ -1507,8 +2510,8 @@ def get_statistics(
     Get calendar statistics and analytics for a date range.
 
     Args:
-        start_date: Start of analysis period (YYYY-MM-DD format)
-        end_date: End of analysis period (YYYY-MM-DD format)
+        start_date: Start of analysis period (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
+        end_date: End of analysis period (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
         calendar: Optional calendar name to analyze (if None, analyzes all calendars)
 
     Returns:
@@ -1519,130 +2522,141 @@ def get_statistics(
         - Average meeting duration
     """
 
-    start_formatted = format_applescript_date(start_date)
-    end_formatted = format_applescript_date(end_date)
-
-    calendar_filter = f'''
-        set targetCalendars to {{calendar "{calendar}"}}
-    ''' if calendar else '''
-        set targetCalendars to every calendar
-    '''
-
-    script = f'''
-    tell application "Calendar"
-        set outputText to "CALENDAR STATISTICS" & return & return
-        set outputText to outputText & "Period: {start_date} to {end_date}" & return
-        set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
-
-        set searchStart to date "{start_formatted}"
-        set searchEnd to date "{end_formatted}"
-
-        {calendar_filter}
+    events = await fetch_events(start_date, end_date, calendar)
 
-        -- Initialize counters
-        set totalEvents to 0
-        set totalTimedEvents to 0
-        set totalAllDayEvents to 0
-        set totalMinutes to 0
-        set hourCounts to {{0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}
-        set dayCounts to {{}}
+    output_lines = [
+        "CALENDAR STATISTICS",
+        "",
+        f"Period: {start_date} to {end_date}",
+        SEPARATOR_LINE,
+        ""
+    ]
+    output_lines.extend(format_statistics(events))
+    output_lines.append("")
+    output_lines.append(SEPARATOR_LINE)
+    return "\n".join(output_lines)
 
-        repeat with aCal in targetCalendars
-            try
-                set calEvents to (every event of aCal whose start date >= searchStart and start date <= searchEnd)
-
-                repeat with anEvent in calEvents
-                    set totalEvents to totalEvents + 1
 
-                    if allday event of anEvent then
-                        set totalAllDayEvents to totalAllDayEvents + 1
-                    else
-                        set totalTimedEvents to totalTimedEvents + 1
-
-                        set eventStart to start date of anEvent
-                        set eventEnd to end date of anEvent
-
-                        -- Calculate duration in minutes
-                        set duration to (eventEnd - eventStart)
-                        set durationMinutes to duration / 60
-                        set totalMinutes to totalMinutes + durationMinutes
-
-                        -- Track hour distribution
-                        try
-                            set eventHour to hours of eventStart
-                            if eventHour >= 0 and eventHour < 24 then
-                                set hourIndex to eventHour + 1
-                                set currentCount to item hourIndex of hourCounts
-                                set item hourIndex of hourCounts to currentCount + 1
-                            end if
-                        end try
-                    end if
-                end repeat
-            end try
-        end repeat
+CSV_EXPORT_HEADER = ["Title", "Start Date", "Start Time", "End Date", "End Time", "Location", "Calendar", "All Day"]
 
-        -- Calculate averages
-        set avgDuration to 0
-        if totalTimedEvents > 0 then
-            set avgDuration to totalMinutes / totalTimedEvents
-        end if
+# RFC 5545: content lines are folded at 75 octets and TEXT values escape
+# backslashes, semicolons, commas and newlines
+ICS_LINE_OCTETS = 75
+ICS_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
 
-        set totalHours to totalMinutes / 60
 
-        -- Output statistics
-        set outputText to outputText & "📊 SUMMARY" & return
-        set outputText to outputText & "  Total Events: " & totalEvents & return
-        set outputText to outputText & "  Timed Events: " & totalTimedEvents & return
-        set outputText to outputText & "  All-Day Events: " & totalAllDayEvents & return & return
+def ics_text(value: str) -> str:
+    """Escape a value for an iCalendar TEXT property"""
+    return value.replace("\r\n", "\n").replace("\r", "\n").translate(ICS_TEXT_ESCAPES)
 
-        set outputText to outputText & "⏱  TIME ANALYSIS" & return
-        set outputText to outputText & "  Total Meeting Time: " & (totalHours as integer) & " hours " & ((totalMinutes mod 60) as integer) & " minutes" & return
-        set outputText to outputText & "  Average Meeting Duration: " & (avgDuration as integer) & " minutes" & return & return
 
-        -- Find busiest hours
-        set outputText to outputText & "🕐 BUSIEST HOURS" & return
-        set maxHourCount to 0
-        set busiestHours to {{}}
+def fold_ics_line(line: str) -> str:
+    """Fold a content line so no physical line exceeds ICS_LINE_OCTETS"""
+    if len(line.encode("utf-8")) <= ICS_LINE_OCTETS:
+        return line
+    parts = []
+    current = []
+    size = 0
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > ICS_LINE_OCTETS:
+            parts.append("".join(current))
+            current = []
+            # Continuation lines start with a space, which counts toward the limit
+            size = 1
+        current.append(char)
+        size += char_size
+    parts.append("".join(current))
+    return "\r\n ".join(parts)
 
-        repeat with i from 1 to 24
-            set hourCount to item i of hourCounts
-            if hourCount > maxHourCount then
-                set maxHourCount to hourCount
-            end if
-        end repeat
 
-        if maxHourCount > 0 then
-            repeat with i from 1 to 24
-                set hourCount to item i of hourCounts
-                if hourCount = maxHourCount then
-                    set hourLabel to (i - 1)
-                    if hourLabel < 12 then
-                        set ampm to "AM"
-                        if hourLabel = 0 then set hourLabel to 12
-                    else
-                        set ampm to "PM"
-                        if hourLabel > 12 then set hourLabel to hourLabel - 12
-                    end if
-                    set outputText to outputText & "  " & hourLabel & " " & ampm & ": " & hourCount & " events" & return
-                end if
-            end repeat
-        else
-            set outputText to outputText & "  No timed events in this period" & return
-        end if
+def ics_utc(dt: datetime) -> str:
+    """Render a local date-time as an iCalendar UTC date-time"""
+    return f"{dt.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
 
-        set outputText to outputText & return & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return
 
-        return outputText
-    end tell
-    '''
+def ics_event_lines(event: EventRecord, stamp: str, occurrence: bool = False) -> List[str]:
+    """Content lines of one VEVENT
 
-    result = run_applescript(script)
-    return result
+    The event keeps Calendar's UID. One occurrence of a recurring event,
+    whose UID other exported events share, also gets a RECURRENCE-ID.
+    """
+    if event.uid:
+        uid = event.uid
+    else:
+        digest = hashlib.sha1(f"{event.calendar}{FIELD_SEPARATOR}{event.start.isoformat()}{FIELD_SEPARATOR}{event.title}".encode("utf-8")).hexdigest()
+        uid = f"{digest}@apple-calendar-mcp"
+    lines = ["BEGIN:VEVENT", f"UID:{ics_text(uid)}", f"DTSTAMP:{stamp}"]
+    if event.all_day:
+        # DTEND is exclusive for all-day events: the day after the last one
+        last_day = (event.end - timedelta(seconds=1)).date()
+        if occurrence:
+            lines.append(f"RECURRENCE-ID;VALUE=DATE:{event.start:%Y%m%d}")
+        lines.append(f"DTSTART;VALUE=DATE:{event.start:%Y%m%d}")
+        lines.append(f"DTEND;VALUE=DATE:{last_day + timedelta(days=1):%Y%m%d}")
+    else:
+        # Local times carry no zone of their own, so pin them down in UTC
+        if occurrence:
+            lines.append(f"RECURRENCE-ID:{ics_utc(event.start)}")
+        lines.append(f"DTSTART:{ics_utc(event.start)}")
+        lines.append(f"DTEND:{ics_utc(event.end)}")
+    lines.append(f"SUMMARY:{ics_text(event.title)}")
+    if event.location:
+        lines.append(f"LOCATION:{ics_text(event.location)}")
+    if event.notes:
+        lines.append(f"DESCRIPTION:{ics_text(event.notes)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def write_export(out: TextIO, events: List[EventRecord], format: str, start_date: str, end_date: str) -> None:
+    """Write events to out as CSV, ICS or (for any other format) TXT"""
+    if format == "csv":
+        writer = csv.writer(out, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+        writer.writerow(CSV_EXPORT_HEADER)
+        writer.writerows(
+            [
+                event.title,
+                applescript_date_string(event.start),
+                "All Day" if event.all_day else applescript_time_string(event.start),
+                applescript_date_string(event.end),
+                "All Day" if event.all_day else applescript_time_string(event.end),
+                event.location,
+                event.calendar,
+                "Yes" if event.all_day else "No"
+            ]
+            for event in events
+        )
+        return
+
+    if format == "ics":
+        stamp = ics_utc(datetime.now())
+        uid_counts = Counter(event.uid for event in events if event.uid)
+        out.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Apple Calendar MCP//EN\r\n")
+        for event in events:
+            lines = ics_event_lines(event, stamp, uid_counts[event.uid] > 1)
+            out.writelines(f"{fold_ics_line(line)}\r\n" for line in lines)
+        out.write("END:VCALENDAR\r\n")
+        return
+
+    out.write(f"CALENDAR EXPORT\nPeriod: {start_date} to {end_date}\n{SEPARATOR_LINE}\n\n")
+    for event in events:
+        lines = [f"📌 {event.title}", f"   📅 {applescript_date_string(event.start)}"]
+        if event.all_day:
+            lines.append("   🕐 All Day Event")
+        else:
+            lines.append(f"   🕐 {applescript_time_string(event.start)} - {applescript_time_string(event.end)}")
+        lines.append(f"   📁 {event.calendar}")
+        if event.location:
+            lines.append(f"   📍 {event.location}")
+        lines.append("")
+        out.writelines(f"{line}\n" for line in lines)
+    out.write(f"{SEPARATOR_LINE}\nTotal: {len(events)} event(s) exported\n")
 
 
 @mcp.tool()
 @inject_preferences
-def export_events(
+async def export_events(
     start_date: str,
     end_date: str,
     format: str = "txt",
@@ -1653,8 +2667,8 @@ def export_events(
     Export events to a file in various formats.
 
     Args:
-        start_date: Start of export range (YYYY-MM-DD format)
-        end_date: End of export range (YYYY-MM-DD format)
+        start_date: Start of export range (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
+        end_date: End of export range (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
         format: Export format - "txt", "csv", or "ics" (default: "txt")
         calendar: Optional calendar name to export (if None, exports all calendars)
         output_file: Optional output file path (if None, returns data as string)
@@ -1663,194 +2677,102 @@ def export_events(
         Exported event data or confirmation message if file was written
     """
 
-    start_formatted = format_applescript_date(start_date)
-    end_formatted = format_applescript_date(end_date)
-
-    calendar_filter = f'''
-        set targetCalendars to {{calendar "{calendar}"}}
-    ''' if calendar else '''
-        set targetCalendars to every calendar
-    '''
-
-    if format.lower() == "csv":
-        # CSV format
-        script = f'''
-        tell application "Calendar"
-            set outputText to "Title,Start Date,Start Time,End Date,End Time,Location,Calendar,All Day" & return
-
-            set searchStart to date "{start_formatted}"
-            set searchEnd to date "{end_formatted}"
-
-            {calendar_filter}
-
-            repeat with aCal in targetCalendars
-                set calName to name of aCal
-
-                try
-                    set calEvents to (every event of aCal whose start date >= searchStart and start date <= searchEnd)
-
-                    repeat with anEvent in calEvents
-                        try
-                            set eventTitle to summary of anEvent
-                            set eventStart to start date of anEvent
-                            set eventEnd to end date of anEvent
-                            set isAllDay to allday event of anEvent
-
-                            -- Replace commas in title to avoid CSV issues
-                            set AppleScript's text item delimiters to ","
-                            set titleParts to text items of eventTitle
-                            set AppleScript's text item delimiters to ";"
-                            set eventTitle to titleParts as string
-                            set AppleScript's text item delimiters to ""
-
-                            set evtLoc to ""
-                            try
-                                set evtLoc to location of anEvent
-                                if evtLoc is missing value then set evtLoc to ""
-                                -- Replace commas in location
-                                set AppleScript's text item delimiters to ","
-                                set locParts to text items of evtLoc
-                                set AppleScript's text item delimiters to ";"
-                                set evtLoc to locParts as string
-                                set AppleScript's text item delimiters to ""
-                            end try
-
-                            if isAllDay then
-                                set outputText to outputText & eventTitle & "," & (date string of eventStart) & ",All Day," & (date string of eventEnd) & ",All Day," & evtLoc & "," & calName & ",Yes" & return
-                            else
-                                set outputText to outputText & eventTitle & "," & (date string of eventStart) & "," & (time string of eventStart) & "," & (date string of eventEnd) & "," & (time string of eventEnd) & "," & evtLoc & "," & calName & ",No" & return
-                            end if
-                        end try
-                    end repeat
-                end try
-            end repeat
-
-            return outputText
-        end tell
-        '''
-
-    elif format.lower() == "ics":
-        # ICS/iCalendar format (simplified)
-        script = f'''
-        tell application "Calendar"
-            set outputText to "BEGIN:VCALENDAR" & return
-            set outputText to outputText & "VERSION:2.0" & return
-            set outputText to outputText & "PRODID:-//Apple Calendar MCP//EN" & return & return
-
-            set searchStart to date "{start_formatted}"
-            set searchEnd to date "{end_formatted}"
-
-            {calendar_filter}
-
-            repeat with aCal in targetCalendars
-                try
-                    set calEvents to (every event of aCal whose start date >= searchStart and start date <= searchEnd)
-
-                    repeat with anEvent in calEvents
-                        try
-                            set outputText to outputText & "BEGIN:VEVENT" & return
-
-                            set eventTitle to summary of anEvent
-                            set outputText to outputText & "SUMMARY:" & eventTitle & return
-
-                            try
-                                set evtLoc to location of anEvent
-                                if evtLoc is not missing value and evtLoc is not "" then
-                                    set outputText to outputText & "LOCATION:" & evtLoc & return
-                                end if
-                            end try
-
-                            try
-                                set evtNotes to description of anEvent
-                                if evtNotes is not missing value and evtNotes is not "" then
-                                    set outputText to outputText & "DESCRIPTION:" & evtNotes & return
-                                end if
-                            end try
-
-                            set outputText to outputText & "END:VEVENT" & return & return
-                        end try
-                    end repeat
-                end try
-            end repeat
-
-            set outputText to outputText & "END:VCALENDAR" & return
-
-            return outputText
-        end tell
-        '''
-
-    else:
-        # TXT format (default)
-        script = f'''
-        tell application "Calendar"
-            set outputText to "CALENDAR EXPORT" & return
-            set outputText to outputText & "Period: {start_date} to {end_date}" & return
-            set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return & return
-
-            set searchStart to date "{start_formatted}"
-            set searchEnd to date "{end_formatted}"
-
-            {calendar_filter}
+    format = format.lower()
+    records = await fetch_events(
+        start_date, end_date, calendar, include_notes=format == "ics", include_uids=format == "ics"
+    )
 
-            set eventCount to 0
+    if not output_file:
+        buffer = io.StringIO()
+        write_export(buffer, records, format, start_date, end_date)
+        return buffer.getvalue()
 
-            repeat with aCal in targetCalendars
-                set calName to name of aCal
-
-                try
-                    set calEvents to (every event of aCal whose start date >= searchStart and start date <= searchEnd)
-
-                    repeat with anEvent in calEvents
-                        try
-                            set eventTitle to summary of anEvent
-                            set eventStart to start date of anEvent
-                            set eventEnd to end date of anEvent
-                            set isAllDay to allday event of anEvent
-
-                            set outputText to outputText & "📌 " & eventTitle & return
-                            set outputText to outputText & "   📅 " & date string of eventStart & return
-
-                            if isAllDay then
-                                set outputText to outputText & "   🕐 All Day Event" & return
-                            else
-                                set outputText to outputText & "   🕐 " & time string of eventStart & " - " & time string of eventEnd & return
-                            end if
-
-                            set outputText to outputText & "   📁 " & calName & return
-
-                            try
-                                set evtLoc to location of anEvent
-                                if evtLoc is not missing value and length of evtLoc > 0 then
-                                    set outputText to outputText & "   📍 " & evtLoc & return
-                                end if
-                            end try
+    # Written as it is rendered rather than joined in memory first; newline=""
+    # keeps the CSV and ICS line endings as written
+    output_path = os.path.expanduser(output_file)
+    try:
+        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+            write_export(f, records, format, start_date, end_date)
+    except OSError as e:
+        return f"❌ Error writing to file: {str(e)}"
+    return f"✅ Events exported successfully to: {output_file}\n\nFormat: {format.upper()}\nFile size: {os.path.getsize(output_path)} bytes"
 
-                            set outputText to outputText & return
-                            set eventCount to eventCount + 1
-                        end try
-                    end repeat
-                end try
-            end repeat
 
-            set outputText to outputText & "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" & return
-            set outputText to outputText & "Total: " & eventCount & " event(s) exported" & return
+@mcp.tool()
+@inject_preferences
+@cached_result(ttl=READ_CACHE_TTL)
+async def calendar_report(
+    start_date: str,
+    end_date: str,
+    calendar: Optional[str] = None,
+    include: Optional[List[str]] = None,
+    search_text: Optional[str] = None,
+    search_location: bool = False,
+    search_notes: bool = False
+) -> str:
+    """
+    Combined statistics, conflict and search report over one date range.
+    Reads the calendar once for all sections, so it is faster than calling
+    get_statistics, detect_conflicts and search_events separately.
 
-            return outputText
-        end tell
-        '''
+    Args:
+        start_date: Start of report range (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
+        end_date: End of report range (YYYY-MM-DD or YYYY-MM-DD HH:MM only)
+        calendar: Optional calendar name to report on (if None, uses all calendars)
+        include: Sections to include - any of "statistics", "conflicts", "search"
+            (default: statistics and conflicts, plus search when search_text is given)
+        search_text: Text to search for in event titles (and optionally location/notes)
+        search_location: Whether to also search in event locations (default: False)
+        search_notes: Whether to also search in event notes (default: False)
 
-    result = run_applescript(script)
+    Returns:
+        Report with one section per requested analysis
+    """
 
-    # If output_file specified, write to file
-    if output_file:
-        try:
-            with open(output_file, 'w') as f:
-                f.write(result)
-            return f"✅ Events exported successfully to: {output_file}\n\nFormat: {format.upper()}\nFile size: {len(result)} bytes"
-        except Exception as e:
-            return f"❌ Error writing to file: {str(e)}\n\nData preview:\n{result[:500]}"
+    if include is None:
+        include = ["statistics", "conflicts"] + (["search"] if search_text else [])
+    sections = [section.lower() for section in include]
+
+    search_requested = "search" in sections and bool(search_text)
+    events = await fetch_events(
+        start_date,
+        end_date,
+        calendar,
+        include_notes=search_requested and search_notes
+    )
+
+    output_lines = [
+        "CALENDAR REPORT",
+        "",
+        f"Period: {start_date} to {end_date}",
+        SEPARATOR_LINE,
+        ""
+    ]
+
+    if "statistics" in sections:
+        output_lines.append("CALENDAR STATISTICS")
+        output_lines.append("")
+        output_lines.extend(format_statistics(events))
+        output_lines.extend(["", SEPARATOR_LINE, ""])
+
+    if "conflicts" in sections:
+        output_lines.append("CONFLICT DETECTION")
+        output_lines.append("")
+        output_lines.extend(format_conflicts(find_conflicts(events)))
+        output_lines.extend(["", SEPARATOR_LINE, ""])
+
+    if search_requested:
+        matches = list(filter(event_matcher(search_text, search_location, search_notes), events))
+        output_lines.append(f"SEARCH RESULTS: '{search_text}'")
+        output_lines.append("")
+        if matches:
+            output_lines.extend(format_event_list(matches))
+            output_lines.append(f"Total: {len(matches)} matching event(s)")
+        else:
+            output_lines.append("No events found matching your search.")
+        output_lines.extend(["", SEPARATOR_LINE])
 
-    return result
+    return "\n".join(output_lines).rstrip()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,238 @@
+"""Unit tests for the pure-Python event analysis and formatting helpers
+
+These run without Calendar or AppleScript: the helpers only take
+EventRecord lists, datetimes and strings.
+"""
+
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from apple_calendar_mcp import (
+    CSV_EXPORT_HEADER,
+    FIELD_SEPARATOR,
+    ICS_LINE_OCTETS,
+    RECORD_SEPARATOR,
+    EventRecord,
+    event_matcher,
+    find_conflicts,
+    find_free_slots,
+    fold_ics_line,
+    format_statistics,
+    ics_event_lines,
+    ics_text,
+    parse_date_arg,
+    split_records,
+    write_export,
+)
+
+
+def event(start, end, title="Event", all_day=False, calendar="Work"):
+    return EventRecord(start, end, all_day, calendar, title, "", "")
+
+
+# split_records
+
+def test_split_records_splits_fields_and_pads_stripped_ones():
+    # Output is stripped, so the last record loses its empty trailing fields
+    result = RECORD_SEPARATOR.join([
+        FIELD_SEPARATOR.join(["a", "b", "c"]),
+        FIELD_SEPARATOR.join(["d", ""]),
+        "e",
+    ])
+
+    assert split_records(result, 3) == [["a", "b", "c"], ["d", "", ""], ["e", "", ""]]
+
+
+def test_split_records_of_empty_output():
+    assert split_records("", 3) == []
+
+
+# event_matcher
+
+def test_event_matcher_searches_titles_case_insensitively():
+    matches = event_matcher("STAND", False, False)
+
+    assert matches(EventRecord(None, None, False, "Work", "Daily standup", "", ""))
+    assert not matches(EventRecord(None, None, False, "Work", "Review", "Standing desk", "standup notes"))
+
+
+def test_event_matcher_optionally_searches_location_and_notes():
+    record = EventRecord(None, None, False, "Work", "Review", "Room 4", "Bring the deck")
+
+    assert event_matcher("room", True, False)(record)
+    assert not event_matcher("room", False, True)(record)
+    assert event_matcher("deck", False, True)(record)
+    assert not event_matcher("deck", True, False)(record)
+
+
+# write_export
+
+def test_write_export_csv_quotes_fields_with_commas():
+    lunch = EventRecord(
+        datetime(2025, 1, 6, 12), datetime(2025, 1, 6, 13), False, "Home", 'Lunch, "team"', "Cafe, Main St", ""
+    )
+    out = io.StringIO()
+
+    write_export(out, [lunch], "csv", "2025-01-06", "2025-01-07")
+
+    text = out.getvalue()
+    assert '"Lunch, ""team"""' in text
+    assert '"Cafe, Main St"' in text
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == CSV_EXPORT_HEADER
+    assert rows[1][0] == 'Lunch, "team"'
+    assert rows[1][5] == "Cafe, Main St"
+    assert rows[1][6:] == ["Home", "No"]
+
+
+# find_conflicts
+
+def test_find_conflicts_reports_overlapping_pairs():
+    standup = event(datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 10), "Standup")
+    dentist = event(datetime(2025, 1, 6, 9, 30), datetime(2025, 1, 6, 11), "Dentist")
+    call = event(datetime(2025, 1, 6, 10, 30), datetime(2025, 1, 6, 10, 45), "Call")
+
+    conflicts = find_conflicts([call, dentist, standup])
+
+    assert [(a.title, b.title) for a, b in conflicts] == [("Standup", "Dentist"), ("Dentist", "Call")]
+
+
+def test_find_conflicts_ignores_back_to_back_and_all_day_events():
+    first = event(datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 10))
+    second = event(datetime(2025, 1, 6, 10), datetime(2025, 1, 6, 11))
+    holiday = event(datetime(2025, 1, 6), datetime(2025, 1, 7), all_day=True)
+
+    assert find_conflicts([first, second, holiday]) == []
+
+
+# find_free_slots
+
+def test_find_free_slots_fills_gaps_between_busy_intervals():
+    day = datetime(2025, 1, 6)
+    busy = [(day.replace(hour=9), day.replace(hour=10)), (day.replace(hour=11), day.replace(hour=16))]
+
+    slots = find_free_slots(busy, day.replace(hour=9), day.replace(hour=17), timedelta(hours=1), True, 5)
+
+    assert slots == [
+        (day.replace(hour=10), day.replace(hour=11)),
+        (day.replace(hour=16), day.replace(hour=17)),
+    ]
+
+
+def test_find_free_slots_keeps_to_business_hours_across_days():
+    start = datetime(2025, 1, 6, 16, 30)
+    end = datetime(2025, 1, 8)
+
+    slots = find_free_slots([], start, end, timedelta(hours=1), True, 2)
+
+    assert slots == [
+        (datetime(2025, 1, 7, 9), datetime(2025, 1, 7, 10)),
+        (datetime(2025, 1, 7, 10), datetime(2025, 1, 7, 11)),
+    ]
+
+
+def test_find_free_slots_stops_at_max_slots():
+    start = datetime(2025, 1, 6)
+    slots = find_free_slots([], start, start + timedelta(days=1), timedelta(minutes=30), False, 3)
+
+    assert len(slots) == 3
+    assert slots[0] == (start, start + timedelta(minutes=30))
+
+
+# format_statistics
+
+def test_format_statistics_floors_total_hours():
+    # 1h40m used to be reported as "2 hours 40 minutes"
+    lines = format_statistics([event(datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 10, 40))])
+
+    assert "  Total Meeting Time: 1 hours 40 minutes" in lines
+    assert "  Average Meeting Duration: 100 minutes" in lines
+
+
+def test_format_statistics_counts_and_busiest_hours():
+    events = [
+        event(datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 9, 30)),
+        event(datetime(2025, 1, 7, 9, 15), datetime(2025, 1, 7, 9, 45)),
+        event(datetime(2025, 1, 7, 14), datetime(2025, 1, 7, 15)),
+        event(datetime(2025, 1, 8), datetime(2025, 1, 9), all_day=True),
+    ]
+
+    lines = format_statistics(events)
+
+    assert "  Total Events: 4" in lines
+    assert "  Timed Events: 3" in lines
+    assert "  All-Day Events: 1" in lines
+    assert "  9 AM: 2 events" in lines
+    assert "  2 PM: 1 events" not in lines
+
+
+def test_format_statistics_without_timed_events():
+    lines = format_statistics([event(datetime(2025, 1, 8), datetime(2025, 1, 9), all_day=True)])
+
+    assert "  Total Meeting Time: 0 hours 0 minutes" in lines
+    assert "  No timed events in this period" in lines
+
+
+# ics_text / fold_ics_line
+
+def test_ics_text_escapes_rfc5545_specials():
+    assert ics_text("a,b;c\\d") == "a\\,b\\;c\\\\d"
+    assert ics_text("one\r\ntwo\rthree\nfour") == "one\\ntwo\\nthree\\nfour"
+
+
+def test_fold_ics_line_leaves_short_lines_alone():
+    line = "SUMMARY:" + "x" * (ICS_LINE_OCTETS - len("SUMMARY:"))
+    assert fold_ics_line(line) == line
+
+
+def test_fold_ics_line_limits_octets_per_physical_line():
+    line = "DESCRIPTION:" + "é" * 100
+
+    folded = fold_ics_line(line)
+    parts = folded.split("\r\n")
+
+    assert len(parts) > 1
+    assert all(part.startswith(" ") for part in parts[1:])
+    assert all(len(part.encode("utf-8")) <= ICS_LINE_OCTETS for part in parts)
+    # Unfolding restores the line without splitting a multi-byte character
+    assert "".join([parts[0]] + [part[1:] for part in parts[1:]]) == line
+
+
+# ics_event_lines
+
+def test_ics_event_lines_keep_calendar_uid_and_write_utc_times():
+    start = datetime(2025, 1, 6, 9)
+    meeting = EventRecord(start, start + timedelta(hours=1), False, "Work", "Standup", "", "", "ABC-123")
+
+    lines = ics_event_lines(meeting, "20250101T000000Z")
+
+    assert "UID:ABC-123" in lines
+    assert f"DTSTART:{start.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}" in lines
+    assert not any(line.startswith("RECURRENCE-ID") for line in lines)
+
+
+def test_ics_event_lines_mark_recurring_occurrences():
+    holiday = EventRecord(datetime(2025, 1, 6), datetime(2025, 1, 7), True, "Home", "Holiday", "", "", "H-1")
+
+    lines = ics_event_lines(holiday, "20250101T000000Z", occurrence=True)
+
+    assert "RECURRENCE-ID;VALUE=DATE:20250106" in lines
+    assert "DTSTART;VALUE=DATE:20250106" in lines
+    assert "DTEND;VALUE=DATE:20250107" in lines
+
+
+# parse_date_arg
+
+def test_parse_date_arg_accepts_tool_formats():
+    assert parse_date_arg("2025-01-15") == datetime(2025, 1, 15)
+    assert parse_date_arg("2025-01-15 14:30") == datetime(2025, 1, 15, 14, 30)
+    assert parse_date_arg("2025-1-5") == datetime(2025, 1, 5)
+
+
+@pytest.mark.parametrize("value", ["January 15, 2025", "01/15/2025", "2025-02-30", "2025-01-15 25:00"])
+def test_parse_date_arg_rejects_other_input(value):
+    with pytest.raises(Exception, match="Invalid date"):
+        parse_date_arg(value)
@@ -0,0 +1,40 @@
+"""Unit tests for the calendar name run arguments passed to the scripts
+
+run_applescript is replaced with a stub, so these run without Calendar.
+"""
+
+import asyncio
+
+import pytest
+
+import apple_calendar_mcp
+from apple_calendar_mcp import CALENDAR_NAMES_CACHE, calendar_names_arg
+
+
+@pytest.fixture
+def calendar_names(monkeypatch):
+    """Serve a fixed list of calendar names in place of Calendar"""
+    names = []
+
+    async def run_applescript(script, *args):
+        return "\n".join(names)
+
+    monkeypatch.setattr(apple_calendar_mcp, "run_applescript", run_applescript)
+    CALENDAR_NAMES_CACHE.clear()
+    yield names
+    CALENDAR_NAMES_CACHE.clear()
+
+
+def test_calendar_names_arg_sends_each_shared_name_once(calendar_names):
+    # Two calendars named Home: the scripts read both under one name
+    calendar_names.extend(["Home", "Work", "Home"])
+
+    assert asyncio.run(calendar_names_arg(None)) == "Home\nWork"
+
+
+def test_calendar_names_arg_checks_a_named_calendar(calendar_names):
+    calendar_names.extend(["Home", "Work"])
+
+    assert asyncio.run(calendar_names_arg("Work")) == "Work"
+    with pytest.raises(Exception, match="Calendar not found: Gym"):
+        asyncio.run(calendar_names_arg("Gym"))
@@ -0,0 +1,157 @@
+"""Unit tests for result caching and the persistent osascript host
+
+Calendar is never reached: scripts go to stubs, and the host is a small
+Python program speaking the same JSON-lines protocol.
+"""
+
+import asyncio
+import sys
+from datetime import date
+
+import pytest
+
+import apple_calendar_mcp
+from apple_calendar_mcp import RESULT_CACHE, OsascriptHost, cached_result, delete_event, run_applescript
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    RESULT_CACHE.clear()
+    yield
+    RESULT_CACHE.clear()
+
+
+def counting_read(**cache_args):
+    """A cached read that returns how many times it actually ran"""
+    calls = []
+
+    @cached_result(ttl=30, **cache_args)
+    async def read(value):
+        calls.append(value)
+        return f"{value}:{len(calls)}"
+
+    return read
+
+
+# cached_result
+
+def test_cached_result_serves_repeated_reads_from_the_cache():
+    read = counting_read()
+
+    async def main():
+        return [await read("a"), await read("a"), await read("b")]
+
+    assert asyncio.run(main()) == ["a:1", "a:1", "b:2"]
+
+
+def test_cached_result_scope_is_part_of_the_key():
+    today = [date(2025, 1, 6)]
+    read = counting_read(scope=lambda: today[0])
+
+    async def main():
+        first = await read("a")
+        today[0] = date(2025, 1, 7)
+        return first, await read("a")
+
+    assert asyncio.run(main()) == ("a:1", "a:2")
+
+
+def test_write_tools_invalidate_cached_reads(monkeypatch):
+    async def script_stub(script, *args):
+        return "✅ EVENT DELETED"
+
+    monkeypatch.setattr(apple_calendar_mcp, "run_applescript", script_stub)
+    read = counting_read()
+
+    async def main():
+        first = await read("a")
+        await delete_event("Work", "Standup", "2025-01-06")
+        return first, await read("a")
+
+    assert asyncio.run(main()) == ("a:1", "a:2")
+
+
+def test_cached_result_drops_a_read_that_raced_a_write():
+    read = counting_read()
+
+    async def main():
+        pending = asyncio.ensure_future(read("a"))
+        await asyncio.sleep(0)
+        RESULT_CACHE.clear()
+        return await pending, await read("a")
+
+    assert asyncio.run(main()) == ("a:1", "a:2")
+
+
+# OsascriptHost
+
+HOST_PROGRAM = """
+import json, sys
+for line in sys.stdin:
+    request = json.loads(line)
+    if request["args"] == ["crash"]:
+        sys.exit(1)
+    sys.stdout.write(json.dumps({"ok": True, "result": "host:" + ",".join(request["args"])}) + "\\n")
+    sys.stdout.flush()
+"""
+
+
+@pytest.fixture
+def osascript(monkeypatch, tmp_path):
+    """Run a fake host in place of osascript and record one-shot fallbacks"""
+    program = tmp_path / "host.py"
+    program.write_text(HOST_PROGRAM)
+    spawn = asyncio.create_subprocess_exec
+    state = {"can_start": True, "one_shot": [], "hosts": []}
+
+    async def create_subprocess_exec(*args, **kwargs):
+        if not state["can_start"]:
+            raise FileNotFoundError("osascript")
+        proc = await spawn(sys.executable, str(program), **kwargs)
+        state["hosts"].append(proc)
+        return proc
+
+    async def run_osascript(script, args, timeout=120):
+        state["one_shot"].append(args)
+        return "one-shot"
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+    monkeypatch.setattr(apple_calendar_mcp, "_run_osascript", run_osascript)
+    monkeypatch.setattr(apple_calendar_mcp, "OSASCRIPT_HOST", OsascriptHost())
+    return state
+
+
+def run_with_host(osascript, *calls):
+    """Run the calls in order, stopping the hosts before the event loop closes"""
+    async def main():
+        try:
+            return [await call for call in calls]
+        finally:
+            for proc in osascript["hosts"]:
+                proc.stdin.close()
+                if proc.returncode is None:
+                    proc.kill()
+                await proc.wait()
+
+    return asyncio.run(main())
+
+
+def test_host_runs_scripts(osascript):
+    results = run_with_host(osascript, run_applescript("return argv", "a"), run_applescript("return argv", "b"))
+
+    assert results == ["host:a", "host:b"]
+    assert osascript["one_shot"] == []
+
+
+def test_undelivered_request_falls_back_to_one_shot_osascript(osascript):
+    osascript["can_start"] = False
+
+    assert run_with_host(osascript, run_applescript("return argv", "a")) == ["one-shot"]
+    assert osascript["one_shot"] == [("a",)]
+
+
+def test_request_lost_after_delivery_is_not_retried(osascript):
+    # The script may already have changed the calendar, so it must not run twice
+    with pytest.raises(Exception, match="exited while running"):
+        run_with_host(osascript, run_applescript("return argv", "crash"))
+    assert osascript["one_shot"] == []